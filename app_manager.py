@@ -1,15 +1,24 @@
+import logging
+from functools import lru_cache
 from PySide6.QtWidgets import (
     QGroupBox, QVBoxLayout, QHBoxLayout, QGridLayout, 
     QLabel, QLineEdit, QComboBox, QPushButton, QSizePolicy,
     QScrollArea, QWidget
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFontMetrics
+from PySide6.QtCore import Qt, QTimer, Slot, QSignalBlocker
 from entrance import TestData
 from mpl_canvas import MplCanvas
 
+logger = logging.getLogger(__name__)
+
+_MARKERS = ('o', 's', '^', 'v', 'D', 'p', '*', 'h', '+', 'x')
+
 
 class TestAppManager:   
+    def __init__(self):
+        # Set once a test data generator has been attached to a window's DataTab
+        self._has_test_data = False
+
     def create_test_application(self, num_plots=6, num_params=5, custom_param_labels=None):
         """Create test application
         
@@ -33,30 +42,37 @@ class TestAppManager:
         # Inject test data into DataTab
         window.data_tab.sample_data = test_data.sites
         window.data_tab.test_data_generator = test_data
+        self._has_test_data = True
         
         # Update DataTab labels to match new quantities
         window.data_tab.plot_titles = test_data.plot_titles
         window.data_tab.parameter_labels = test_data.parameter_labels
         window.data_tab.data_display_labels = test_data.data_display_labels
         
-        # Recreate plots container to accommodate new number of plots
-        self._recreate_plots_container(window, num_plots)
+        # Rebuild the UI with updates disabled so Qt does a single relayout and paint
+        window.setUpdatesEnabled(False)
+        try:
+            # Recreate plots container to accommodate new number of plots
+            self._recreate_plots_container(window, num_plots)
         
-        # Recreate top layout to accommodate new number of parameters
-        self._recreate_top_layout(window, num_params)
+            # Recreate top layout to accommodate new number of parameters
+            self._recreate_top_layout(window, num_params)
         
-        # Setup test functionality
-        self._setup_test_functionality(window, test_data, num_plots)
+            # Setup test functionality
+            self._setup_test_functionality(window, test_data, num_plots)
         
-        # Ensure dropdowns are properly initialized
-        if hasattr(window.data_tab, 'populate_range_lists'):
-            window.data_tab.populate_range_lists()
+            # Ensure dropdowns are properly initialized
+            if hasattr(window.data_tab, 'populate_range_lists'):
+                window.data_tab.populate_range_lists()
         
-        if hasattr(window.data_tab, 'setup_connections'):
-            window.data_tab.setup_connections()
+            if hasattr(window.data_tab, 'setup_connections'):
+                window.data_tab.setup_connections()
         
-        # Enable sample selection
-        window.data_tab.populate_site_list()
+            # Enable sample selection
+            window.data_tab.populate_site_list()
+        finally:
+            window.setUpdatesEnabled(True)
+        window.update()
         
         return window
 
@@ -64,6 +80,9 @@ class TestAppManager:
     def _setup_test_functionality(self, window, test_data, num_plots):
         """Setup test functionality"""
         
+        # Memoize condition checks; call cache_clear() after regenerating test data
+        check_condition = lru_cache(maxsize=512)(test_data.check_parameter_condition_independently)
+        
         # 存储每个参数的最后确认状态
         def initialize_parameter_states():
             """Initialize parameter confirmed states"""
@@ -77,170 +96,84 @@ class TestAppManager:
         def apply_filter_colors_and_text_colors_independent(site, specimen):
             """Apply filter colors independently for each parameter"""
             try:
-                from config import LayoutConfig
-                
-                # Get current Range settings
-                try:
-                    range_up = int(window.data_tab.range_up_combo.currentText())
-                    range_down = int(window.data_tab.range_down_combo.currentText())
-                except (ValueError, AttributeError):
-                    range_up = 100
-                    range_down = 1
+                range_up, range_down = window.data_tab.get_range()
+                condition_strs = [filter_input.text().strip() for filter_input
+                                  in window.data_tab.filter_inputs[:len(test_data.parameter_labels)]]
+                if not any(condition_strs):
+                    window.data_tab.reset_filter_states()
+                    return
                 
-                # Use filter color styles from config
-                filter_colors = LayoutConfig.STYLES['filter_colors']
+                param_matches = test_data.check_all_parameter_conditions(
+                    site, specimen, condition_strs, range_up, range_down
+                )
                 
-                # Apply colors to each data box independently
-                for i, data_box in enumerate(window.data_tab.data_boxes):
-                    if i < len(test_data.parameter_labels) and i < len(window.data_tab.filter_inputs):
-                        filter_input = window.data_tab.filter_inputs[i]
-                        condition_str = filter_input.text().strip()
-
-                        param_match = test_data.check_parameter_condition_independently(
-                            site, specimen, i, condition_str, range_up, range_down
-                        )
-
-                        if not condition_str or not condition_str.strip():
-                            data_box.setStyleSheet(f"""
-                                QLineEdit {{
-                                    background-color: {filter_colors['default_background']};
-                                    color: {filter_colors['default_text']};
-                                    border: 1px solid #cccccc;
-                                    border-radius: 3px;
-                                    padding: 4px;
-                                    font-size: 9pt;
-                                }}
-                            """)
-                        elif param_match:
-                            data_box.setStyleSheet(f"""
-                                QLineEdit {{
-                                    background-color: {filter_colors['match_background']};
-                                    color: {filter_colors['match_text']};
-                                    border: {filter_colors['match_border']};
-                                    border-radius: 3px;
-                                    padding: 4px;
-                                    font-size: 9pt;
-                                    font-weight: bold;
-                                }}
-                            """)
+                # Apply colors to each data box independently, repainting the group once
+                data_group = window.data_tab._data_group
+                data_group.setUpdatesEnabled(False)
+                try:
+                    for i, data_box in enumerate(window.data_tab.data_boxes):
+                        if i < len(condition_strs):
+                            style_key = self._filter_style_key(condition_strs[i], param_matches[i])
                         else:
-                            data_box.setStyleSheet(f"""
-                                QLineEdit {{
-                                    background-color: {filter_colors['no_match_background']};
-                                    color: {filter_colors['no_match_text']};
-                                    border: {filter_colors['no_match_border']};
-                                    border-radius: 3px;
-                                    padding: 4px;
-                                    font-size: 9pt;
-                                    font-weight: bold;
-                                }}
-                            """)
-                    else:
-                        data_box.setStyleSheet(f"""
-                            QLineEdit {{
-                                background-color: {filter_colors['default_background']};
-                                color: {filter_colors['default_text']};
-                                border: 1px solid #cccccc;
-                                border-radius: 3px;
-                                padding: 4px;
-                                font-size: 9pt;
-                            }}
-                        """)
-                
-                # 强制UI刷新
-                for data_box in window.data_tab.data_boxes:
-                    data_box.update()
-                    data_box.repaint()
+                            style_key = 'default'
+                    
+                        window.data_tab.set_filter_state(data_box, style_key)
+                finally:
+                    data_group.setUpdatesEnabled(True)
                 
-            except Exception as e:
-                print(f"Error applying filter colors: {e}")
+            except Exception:
+                logger.exception("Error applying filter colors")
         
         def update_single_parameter_color(parameter_index, condition_str):
             """Update color for a single parameter only"""
             try:
-                current_site = window.data_tab.site_combo.currentText()
-                current_specimen = window.data_tab.specimen_combo.currentText()
-                
-                if (current_site == "Select a site..." or 
-                    current_specimen == "Select a specimen..." or
-                    not current_site or not current_specimen):
+                if not window.data_tab._selection_valid:
                     return
+                current_site = window.data_tab._current_site
+                current_specimen = window.data_tab._current_specimen
                 
                 if (parameter_index >= len(window.data_tab.data_boxes) or 
                     parameter_index >= len(test_data.parameter_labels)):
                     return
                 
-                from config import LayoutConfig
-                filter_colors = LayoutConfig.STYLES['filter_colors']
-                
-                # Get current Range settings
-                try:
-                    range_up = int(window.data_tab.range_up_combo.currentText())
-                    range_down = int(window.data_tab.range_down_combo.currentText())
-                except (ValueError, AttributeError):
-                    range_up = 100
-                    range_down = 1
-                
-                param_match = test_data.check_parameter_condition_independently(
-                    current_site, current_specimen, parameter_index, condition_str, range_up, range_down
-                )
-                
                 data_box = window.data_tab.data_boxes[parameter_index]
                 
-                if not condition_str or not condition_str.strip():
-                    data_box.setStyleSheet(f"""
-                        QLineEdit {{
-                            background-color: {filter_colors['default_background']};
-                            color: {filter_colors['default_text']};
-                            border: 1px solid #cccccc;
-                            border-radius: 3px;
-                            padding: 4px;
-                            font-size: 9pt;
-                        }}
-                    """)
-                elif param_match:
-                    data_box.setStyleSheet(f"""
-                        QLineEdit {{
-                            background-color: {filter_colors['match_background']};
-                            color: {filter_colors['match_text']};
-                            border: {filter_colors['match_border']};
-                            border-radius: 3px;
-                            padding: 4px;
-                            font-size: 9pt;
-                            font-weight: bold;
-                        }}
-                    """)
+                # Use the predicate compiled on editingFinished when it matches this text
+                compiled = None
+                if parameter_index < len(window.data_tab.filter_inputs):
+                    compiled = getattr(window.data_tab.filter_inputs[parameter_index], '_compiled_filter', None)
+                if compiled is not None and compiled[0] == condition_str and compiled[1] is not None:
+                    param_match = compiled[1](data_box.text())
                 else:
-                    data_box.setStyleSheet(f"""
-                        QLineEdit {{
-                            background-color: {filter_colors['no_match_background']};
-                            color: {filter_colors['no_match_text']};
-                            border: {filter_colors['no_match_border']};
-                            border-radius: 3px;
-                            padding: 4px;
-                            font-size: 9pt;
-                            font-weight: bold;
-                        }}
-                    """)
+                    range_up, range_down = window.data_tab.get_range()
+                    param_match = check_condition(
+                        current_site, current_specimen, parameter_index, condition_str, range_up, range_down
+                    )
                 
-                data_box.update()
-                data_box.repaint()
+                window.data_tab.set_filter_state(data_box, self._filter_style_key(condition_str, param_match))
                 
-            except Exception as e:
-                print(f"Error updating single parameter color: {e}")
+            except Exception:
+                logger.exception("Error updating single parameter color")
+        
+        def show_specimen_summary(specimen_summary):
+            """Write summary values into the data boxes as one batched update"""
+            data_group = window.data_tab._data_group
+            data_group.setUpdatesEnabled(False)
+            try:
+                for data_box, value in zip(window.data_tab.data_boxes, specimen_summary.values()):
+                    if data_box.text() == value:
+                        continue
+                    with QSignalBlocker(data_box):
+                        data_box.setText(value)
+            finally:
+                data_group.setUpdatesEnabled(True)
         
         # Define load_test_specimen_data that uses apply_filter_colors_and_text_colors
         def load_test_specimen_data(site, specimen):
             """Load test specimen data"""
             print(f"Loading test data for {site} - {specimen}")
             
-            # Get current Range settings
-            try:
-                range_up = int(window.data_tab.range_up_combo.currentText())
-                range_down = int(window.data_tab.range_down_combo.currentText())
-            except (ValueError, AttributeError):
-                range_up = 100
-                range_down = 1
+            range_up, range_down = window.data_tab.get_range()
     
             # Generate test data
             specimen_data = test_data.generate_specimen_data(site, specimen)
@@ -249,12 +182,7 @@ class TestAppManager:
             specimen_summary = test_data.get_range_based_specimen_summary(site, specimen, range_up, range_down)
             
             # Update data display box content
-            for i, (key, value) in enumerate(specimen_summary.items()):
-                if i < len(window.data_tab.data_boxes):
-                    data_box = window.data_tab.data_boxes[i]
-                    data_box.setText(value)
-                    # Temporarily use default style, colors will be set later
-                    data_box.setStyleSheet("QLineEdit { background-color: white; color: black; }")
+            show_specimen_summary(specimen_summary)
     
             # Update plots
             window.data_tab.update_all_plots(site, specimen)
@@ -263,30 +191,37 @@ class TestAppManager:
             apply_filter_colors_and_text_colors_independent(site, specimen)
 
         # Define on_range_changed function at the top level
+        @Slot()
         def on_range_changed():
             """Handle range changes"""
-            current_site = window.data_tab.site_combo.currentText()
-            current_specimen = window.data_tab.specimen_combo.currentText()
+            current_site = window.data_tab._current_site
+            current_specimen = window.data_tab._current_specimen
             
-            if (current_site != "Select a site..." and 
-                current_specimen != "Select a specimen..." and
-                current_site and current_specimen):
-                try:
-                    range_up = int(window.data_tab.range_up_combo.currentText())
-                    range_down = int(window.data_tab.range_down_combo.currentText())
-                except ValueError:
-                    range_up = 100
-                    range_down = 1
-                    
+            if window.data_tab._selection_valid:
+                range_up, range_down = window.data_tab.get_range()
                 specimen_summary = test_data.get_range_based_specimen_summary(
                     current_site, current_specimen, range_up, range_down)
-                    
-                for i, (key, value) in enumerate(specimen_summary.items()):
-                    if i < len(window.data_tab.data_boxes):
-                        data_box = window.data_tab.data_boxes[i]
-                        data_box.setText(value)
+                show_specimen_summary(specimen_summary)
             apply_filter_colors_and_text_colors_independent(current_site, current_specimen)
         
+        @Slot()
+        def update_selection_flag():
+            """Cache the current site/specimen and whether both are selected"""
+            site = window.data_tab.site_combo.currentText()
+            specimen = window.data_tab.specimen_combo.currentText()
+            window.data_tab._current_site = site
+            window.data_tab._current_specimen = specimen
+            window.data_tab._selection_valid = bool(
+                site and specimen and
+                site != "Select a site..." and
+                specimen != "Select a specimen...")
+        
+        def setup_selection_listeners():
+            """Track site/specimen selection so handlers avoid re-reading the combos"""
+            update_selection_flag()
+            window.data_tab.site_combo.currentTextChanged.connect(update_selection_flag)
+            window.data_tab.specimen_combo.currentTextChanged.connect(update_selection_flag)
+        
         def setup_filter_listeners():
             """Setup filter condition input box listeners with independent parameter handling"""
             initialize_parameter_states()
@@ -296,24 +231,41 @@ class TestAppManager:
                     param_label = test_data.parameter_labels[i]
                     
                     def create_parameter_handlers(parameter_index, parameter_label, input_widget):
+                        # Coalesce fast typing into one recolor once the user pauses
+                        recolor_timer = QTimer(input_widget)
+                        recolor_timer.setSingleShot(True)
+                        recolor_timer.setInterval(80)
+                        
+                        @Slot()
+                        def on_recolor_timeout():
+                            try:
+                                update_single_parameter_color(parameter_index, input_widget.text().strip())
+                            except Exception:
+                                logger.exception("Error in filter text changed")
+                        
+                        recolor_timer.timeout.connect(on_recolor_timeout)
+                        
+                        @Slot()
                         def on_filter_editing_finished():
-                            # 输入完成时更新这个参数的颜色
+                            # 输入完成时立即更新这个参数的颜色
+                            recolor_timer.stop()
                             try:
                                 current_text = input_widget.text().strip()
                                 # 存储确认的状态
                                 if hasattr(window.data_tab, '_parameter_confirmed_states'):
                                     window.data_tab._parameter_confirmed_states[parameter_label] = current_text
+                                # Parse the condition once per edit
+                                input_widget._compiled_filter = (
+                                    current_text, test_data.compile_filter_expression(current_text))
                                 # 更新颜色
                                 update_single_parameter_color(parameter_index, current_text)
-                            except Exception as e:
-                                print(f"Error in filter editing finished: {e}")
+                            except Exception:
+                                logger.exception("Error in filter editing finished")
                         
+                        @Slot(str)
                         def on_filter_text_changed(text):
-                            # 文本变化时实时更新颜色（实现即时反馈）
-                            try:
-                                update_single_parameter_color(parameter_index, text.strip())
-                            except Exception as e:
-                                print(f"Error in filter text changed: {e}")
+                            # 文本变化时重新计时，停顿后再更新颜色
+                            recolor_timer.start()
                         
                         return on_filter_editing_finished, on_filter_text_changed
                     
@@ -324,26 +276,33 @@ class TestAppManager:
     
         def setup_range_listeners():
             """Setup Range Tab control listeners"""
-            # Use the on_range_changed function defined above
+            # DataTab caches the parsed range on its own, earlier connection,
+            # so on_range_changed reads fresh values
             if hasattr(window.data_tab, 'range_up_combo'):
                 window.data_tab.range_up_combo.currentTextChanged.connect(on_range_changed)
             if hasattr(window.data_tab, 'range_down_combo'):
                 window.data_tab.range_down_combo.currentTextChanged.connect(on_range_changed)
     
         # 设置回调
+        window.data_tab._condition_check = check_condition
         window.data_tab.load_specimen_data = load_test_specimen_data
+        setup_selection_listeners()
         window.data_tab.setup_connections()
         setup_filter_listeners()
         setup_range_listeners()
 
+    def _filter_style_key(self, condition_str, param_match):
+        """Map a filter condition and its result to a data box style key"""
+        if not condition_str or not condition_str.strip():
+            return 'default'
+        return 'match' if param_match else 'no_match'
+
     def _plot_single_line(self, canvas, data, plot_index, colors, alpha):
         """Plot single line graph"""
         canvas.ax.clear()
         
-        markers = ['o', 's', '^', 'v', 'D', 'p', '*', 'h', '+', 'x']
-        
         color = colors[plot_index % len(colors)]
-        marker = markers[plot_index % len(markers)]
+        marker = _MARKERS[plot_index % len(_MARKERS)]
         
         if plot_index % 3 == 0:  # Line only
             canvas.ax.plot(data['x'], data['y'], color=color, linewidth=2, alpha=alpha)
@@ -358,7 +317,7 @@ class TestAppManager:
         canvas.ax.set_ylabel(data['ylabel'])
         canvas.ax.grid(True, alpha=0.3)
         canvas.ax.set_aspect('auto')
-        canvas.draw()
+        canvas.draw_idle()
     
     def _plot_multi_line(self, canvas, data, colors, alpha):
         """Plot multi-line graph"""
@@ -376,88 +335,66 @@ class TestAppManager:
         canvas.ax.legend()
         canvas.ax.grid(True, alpha=0.3)
         canvas.ax.set_aspect('auto')
-        canvas.draw()
+        canvas.draw_idle()
     
     def _recreate_top_layout(self, window, num_params):
         """Recreate top layout to accommodate new number of parameters"""
         data_tab = window.data_tab
         new_filter_group = self._create_dynamic_filter_group(data_tab, num_params)
         new_data_group = self._create_dynamic_data_group(data_tab, num_params)
-        layout_found = False
-        for i in range(data_tab.layout().count()):
-            item = data_tab.layout().itemAt(i)
-            if item and hasattr(item, 'layout') and isinstance(item.layout(), QHBoxLayout):
-                top_layout = item.layout()
-                for j in range(top_layout.count()):
-                    widget_item = top_layout.itemAt(j)
-                    if widget_item and widget_item.widget() and isinstance(widget_item.widget(), QGroupBox):
-                        if "Filter" in widget_item.widget().title():
-                            old_filter_widget = widget_item.widget()
-                            top_layout.removeWidget(old_filter_widget)
-                            top_layout.insertWidget(j, new_filter_group)
-                            old_filter_widget.setParent(None)
-                            old_filter_widget.deleteLater()
-                            layout_found = True
-                            break
-            
-            if layout_found:
-                break
-        data_layout_found = False
-        for i in range(data_tab.layout().count()):
-            item = data_tab.layout().itemAt(i)
-            if item and hasattr(item, 'layout') and isinstance(item.layout(), QHBoxLayout):
-                middle_layout = item.layout()
-                # Check if this layout contains data group
-                for j in range(middle_layout.count()):
-                    widget_item = middle_layout.itemAt(j)
-                    if widget_item and widget_item.widget() and isinstance(widget_item.widget(), QGroupBox):
-                        if "Data" in widget_item.widget().title() and "Specimen" in widget_item.widget().title():
-                            old_data_widget = widget_item.widget()
-                            middle_layout.removeWidget(old_data_widget)
-                            middle_layout.insertWidget(j, new_data_group)
-                            old_data_widget.setParent(None)
-                            old_data_widget.deleteLater()
-                            data_layout_found = True
-                            break
-            
-            if data_layout_found:
-                break
+        data_tab._filter_group = self._replace_group(
+            data_tab._top_layout, data_tab._filter_group, new_filter_group)
+        data_tab._data_group = self._replace_group(
+            data_tab._middle_layout, data_tab._data_group, new_data_group)
         data_tab.updateGeometry()
         data_tab.update()
     
     def _recreate_plots_container(self, window, num_plots):
         """Recreate plots container to accommodate new number of plots"""
         data_tab = window.data_tab
-        config = data_tab.config.DATA_TAB['plots_container']
+        if len(data_tab.plot_groups) == num_plots:
+            # Same plot count: keep the existing groups and canvases
+            self._retitle_plot_groups(data_tab)
+            return
+        new_plots_container = self._create_new_plots_container(data_tab, num_plots)
+        data_tab._plots_container = self._replace_group(
+            data_tab._middle_layout, data_tab._plots_container, new_plots_container)
+    
+    def _retitle_plot_groups(self, data_tab):
+        """Bring existing plot groups in line with data_tab.plot_titles in place"""
+        individual_style = data_tab._get_groupbox_style('individual_plot')
+        for plot_group, canvas, title in zip(data_tab.plot_groups, data_tab.canvases, data_tab.plot_titles):
+            if plot_group.styleSheet() != individual_style:
+                plot_group.setStyleSheet(individual_style)
+            if plot_group.title() == title:
+                continue
+            plot_group.setTitle(title)
+            canvas.ax.clear()
+            data_tab._set_no_data_placeholder(canvas, title)
+            canvas.ax.set_aspect('equal', adjustable='box')
+            canvas.draw_idle()
+    
+    def _replace_group(self, parent_layout, old_group, new_group):
+        """Swap a group box in place, keeping its layout position and stretch
         
-        # Find and remove original plots container
-        for i in range(data_tab.layout().count()):
-            item = data_tab.layout().itemAt(i)
-            if item and hasattr(item, 'widget'):
-                widget = item.widget()
-                if hasattr(widget, 'layout') and widget.layout():
-                    for j in range(widget.layout().count()):
-                        sub_item = widget.layout().itemAt(j)
-                        if sub_item and hasattr(sub_item, 'widget'):
-                            sub_widget = sub_item.widget()
-                            if isinstance(sub_widget, QGroupBox) and sub_widget.title() == config['title']:
-                                # Found plots container, replace it
-                                old_plots_container = sub_widget
-                                new_plots_container = self._create_new_plots_container(data_tab, num_plots)
-                                parent_layout = widget.layout()
-                                index = parent_layout.indexOf(old_plots_container)
-                                parent_layout.removeWidget(old_plots_container)
-                                parent_layout.insertWidget(index, new_plots_container)
-                                old_plots_container.setParent(None)
-                                old_plots_container.deleteLater()
-                                return
+        Args:
+            parent_layout (QBoxLayout): Layout holding the old group
+            old_group (QGroupBox): Group to remove
+            new_group (QGroupBox): Group to insert
+            
+        Returns:
+            QGroupBox: The inserted group
+        """
+        parent_layout.replaceWidget(old_group, new_group)
+        old_group.setParent(None)
+        old_group.deleteLater()
+        return new_group
     
     def _create_dynamic_filter_group(self, data_tab, num_params):
         """Create dynamic number of filter group - supports adaptive labels"""
         config = data_tab.config.DATA_TAB['filter_group']
         
         filter_group = QGroupBox(config['title'])
-        filter_group.setStyleSheet(data_tab._get_groupbox_style('filter_group'))
         filter_group.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         # Clear old layout (if exists)
         if filter_group.layout():
@@ -472,6 +409,17 @@ class TestAppManager:
         # Calculate available width
         cols_per_row = (num_params + 1) // 2
         
+        # One group-level stylesheet; children opt in through their "role" property
+        filter_group.setStyleSheet(data_tab._get_groupbox_style('filter_group') + f"""
+            QLabel[role="param_label"] {{
+                font-weight: {data_tab.config.STYLES['label']['font_weight']};
+                color: {data_tab.config.STYLES['label']['color']};
+                font-size: 8pt;  /* Use smaller font */
+                margin-right: 0px;
+                padding-right: 0px;
+            }}
+        """ + data_tab._get_lineedit_style().replace('QLineEdit', 'QLineEdit[role="filter_input"]'))
+        
         # Create adaptive labels
         for i in range(num_params):
             label_text = data_tab.parameter_labels[i]
@@ -483,13 +431,7 @@ class TestAppManager:
                 label = data_tab._create_adaptive_label(f"{label_text}:", max_label_width, 8)
             else:
                 label = QLabel(f"{label_text}:")
-                label.setStyleSheet(f"""
-                    font-weight: {data_tab.config.STYLES['label']['font_weight']};
-                    color: {data_tab.config.STYLES['label']['color']};
-                    font-size: 8pt;  /* Use smaller font */
-                    margin-right: 0px;
-                    padding-right: 0px;
-                """)
+                label.setProperty("role", "param_label")
             
             label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
             label.setMaximumWidth(max_label_width)
@@ -503,12 +445,7 @@ class TestAppManager:
             input_field = QLineEdit()
             input_field.setPlaceholderText(">10")  # Simplified placeholder
             input_field.setFixedWidth(config['input_width'] + 30)  # Increase width
-            input_field.setStyleSheet(f"""
-                {data_tab._get_lineedit_style()}
-                margin-left: 0px;
-                padding-left: 0px;
-                font-size: 8pt;  /* Use smaller font */
-            """)
+            input_field.setProperty("role", "filter_input")
             
             # Add tooltip
             input_field.setToolTip(
@@ -525,21 +462,17 @@ class TestAppManager:
             
             label_col = col_pair * 3
             input_col = col_pair * 3 + 1
-            spacer_col = col_pair * 3 + 2
             
             # Add to layout
             filter_layout.addWidget(label, row, label_col)
             filter_layout.addWidget(input_field, row, input_col)
-            
-            # Set column width and stretch
-            filter_layout.setColumnStretch(label_col, 0)
-            filter_layout.setColumnMinimumWidth(label_col, max_label_width)
-            filter_layout.setColumnStretch(input_col, 0)
-            filter_layout.setColumnMinimumWidth(input_col, config['input_width'] + 30)
-            
+        
+        # Set column widths once per column pair (columns keep the default zero stretch)
+        for col_pair in range(cols_per_row):
+            filter_layout.setColumnMinimumWidth(col_pair * 3, max_label_width)
+            filter_layout.setColumnMinimumWidth(col_pair * 3 + 1, config['input_width'] + 30)
             if col_pair < cols_per_row - 1:
-                filter_layout.setColumnStretch(spacer_col, 0)
-                filter_layout.setColumnMinimumWidth(spacer_col, 15)
+                filter_layout.setColumnMinimumWidth(col_pair * 3 + 2, 15)
     
         filter_layout.setHorizontalSpacing(5)
         filter_layout.setVerticalSpacing(8)
@@ -557,7 +490,6 @@ class TestAppManager:
         config = data_tab.config.DATA_TAB['data_group']
         
         data_group = QGroupBox(config['title'])
-        data_group.setStyleSheet(data_tab._get_groupbox_style('data_group'))
         data_group.setMinimumWidth(config['min_width'])
         data_group.setMaximumWidth(config['max_width'])
         data_group.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
@@ -567,9 +499,9 @@ class TestAppManager:
         data_layout.setSpacing(3)
         data_tab.data_boxes = []
         
-        for i in range(num_params):
-            label = QLabel(data_tab.data_display_labels[i])
-            label.setStyleSheet(f"""
+        # One group-level stylesheet; children opt in through their "role" property
+        data_group.setStyleSheet(data_tab._get_groupbox_style('data_group') + f"""
+            QLabel[role="data_label"] {{
                 font-weight: {data_tab.config.STYLES['label']['font_weight']};
                 color: {data_tab.config.STYLES['label']['color']};
                 font-size: {data_tab.config.STYLES['label']['font_size']['small']};
@@ -578,7 +510,13 @@ class TestAppManager:
                 border: 1px solid #ccc;
                 border-radius: 3px;
                 margin: 0px;
-            """)
+            }}
+        """ + data_tab._get_data_display_style().replace('QLineEdit', 'QLineEdit[role="data_display"]')
+            + data_tab._get_filter_state_style())
+        
+        for i in range(num_params):
+            label = QLabel(data_tab.data_display_labels[i])
+            label.setProperty("role", "data_label")
             label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             label.setFixedHeight(20)
             
@@ -586,11 +524,7 @@ class TestAppManager:
             data_display = QLineEdit()
             data_display.setReadOnly(True)
             data_display.setFixedHeight(35)
-            data_display.setStyleSheet(f"""
-                {data_tab._get_data_display_style()}
-                margin: 0px;
-                padding: 2px;
-            """)
+            data_display.setProperty("role", "data_display")
             data_display.setPlaceholderText("No data")
             
             data_tab.data_boxes.append(data_display)
@@ -641,23 +575,26 @@ class TestAppManager:
         scroll_content.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         scroll_content.wheelEvent = data_tab.scroll_area_wheel_event
         
-        # Create grid layout, maintain 2 columns n rows format
-        main_grid_layout = QGridLayout(scroll_content)
-        main_grid_layout.setSpacing(config['grid_spacing'])
-        main_grid_layout.setContentsMargins(*config['scroll_margins'])
-        data_tab.plot_groups = []
-        data_tab.canvases = []
+        # One HBox row per pair of plots, maintain 2 columns n rows format
+        rows_layout = QVBoxLayout(scroll_content)
+        rows_layout.setSpacing(config['grid_spacing'])
+        rows_layout.setContentsMargins(*config['scroll_margins'])
+        # Sized up front; each slot is filled by index as its group is built
+        data_tab.plot_groups = [None] * num_plots
+        data_tab.canvases = [None] * num_plots
         for i in range(num_plots):
             plot_group = self._create_individual_plot_group(data_tab, i, data_tab.plot_titles[i])
-            data_tab.plot_groups.append(plot_group)
+            data_tab.plot_groups[i] = plot_group
             
-            # Calculate row and column position (2 columns, n rows)
-            row = i // 2
-            col = i % 2
-            main_grid_layout.addWidget(plot_group, row, col)
-            # Set row and column stretch factors
-            main_grid_layout.setRowStretch(row, 1)
-            main_grid_layout.setColumnStretch(col, 1)
+            # Start a new row every 2 plots; rows and columns share space equally
+            if i % 2 == 0:
+                row_layout = QHBoxLayout()
+                row_layout.setSpacing(config['grid_spacing'])
+                rows_layout.addLayout(row_layout, 1)
+            row_layout.addWidget(plot_group, 1)
+        # Keep a lone plot in the last row at column width
+        if num_plots % 2:
+            row_layout.addStretch(1)
         # Set scroll content
         scroll_area.setWidget(scroll_content)
         data_tab.scroll_area = scroll_area
@@ -680,13 +617,15 @@ class TestAppManager:
         
         # Refresh button
         refresh_btn = QPushButton("Refresh")
-        refresh_btn.clicked.connect(lambda checked, idx=index: data_tab.refresh_plot(idx))
+        refresh_btn.setProperty("plot_idx", index)
+        refresh_btn.clicked.connect(data_tab._on_refresh_clicked)
         refresh_btn.setMaximumWidth(config['button_max_width'])
         refresh_btn.setStyleSheet(data_tab._get_button_style())
         
         # Export button
         export_btn = QPushButton("Export")
-        export_btn.clicked.connect(lambda checked, idx=index: data_tab.export_plot(idx))
+        export_btn.setProperty("plot_idx", index)
+        export_btn.clicked.connect(data_tab._on_export_clicked)
         export_btn.setMaximumWidth(config['button_max_width'])
         export_btn.setStyleSheet(data_tab._get_button_style())
         
@@ -701,13 +640,11 @@ class TestAppManager:
         
         # Set fixed aspect ratio to 1:1 (square)
         canvas.setFixedAspectRatio(True)
-        canvas.ax.set_title(title)
-        canvas.ax.text(0.5, 0.5, f'{title}\n(No Data)', 
-                      ha='center', va='center', transform=canvas.ax.transAxes)
-        canvas.ax.grid(True, alpha=0.3)
+        data_tab._set_no_data_placeholder(canvas, title)
         canvas.ax.set_aspect('equal', adjustable='box')
-        canvas.draw()
-        data_tab.canvases.append(canvas)
+        # No eager draw(): the canvas renders on its first resize/show
+        canvas._plot_style = data_tab._plot_style(index)
+        data_tab.canvases[index] = canvas
 
         plot_layout.addLayout(control_layout)
         plot_layout.addWidget(canvas, 1)
@@ -722,97 +659,43 @@ class TestAppManager:
 
     def apply_filter_colors_and_text_colors(self, window, site, specimen):
         """Apply filter colors and text colors to data boxes based on independent parameter conditions"""
-        if not hasattr(window.data_tab, 'test_data_generator'):
+        if not self._has_test_data:
             return
         
         test_data = window.data_tab.test_data_generator
+        range_up, range_down = window.data_tab.get_range()
+        condition_strs = [filter_input.text().strip() for filter_input
+                          in window.data_tab.filter_inputs[:len(test_data.parameter_labels)]]
+        if not any(condition_strs):
+            window.data_tab.reset_filter_states()
+            return
         
-        # Get current range settings
-        try:
-            range_up = int(window.data_tab.range_up_combo.currentText())
-            range_down = int(window.data_tab.range_down_combo.currentText())
-        except (ValueError, AttributeError):
-            range_up = 100
-            range_down = 1
-        from config import LayoutConfig
-        filter_colors = LayoutConfig.STYLES['filter_colors']
+        # Check all parameter conditions in one pass
+        param_matches = test_data.check_all_parameter_conditions(
+            site, specimen, condition_strs, range_up, range_down
+        )
     
-        # Apply colors to each data box independently
-        for i, data_box in enumerate(window.data_tab.data_boxes):
-            if i < len(test_data.parameter_labels) and i < len(window.data_tab.filter_inputs):
-                # Get the condition for this specific parameter only
-                filter_input = window.data_tab.filter_inputs[i]
-                condition_str = filter_input.text().strip()
-                
-                # Check this parameter condition independently
-                param_match = test_data.check_parameter_condition_independently(
-                    site, specimen, i, condition_str, range_up, range_down
-                )
-                
-                if not condition_str or not condition_str.strip():
-
-                    data_box.setStyleSheet(f"""
-                        QLineEdit {{
-                            background-color: {filter_colors['default_background']};
-                            color: {filter_colors['default_text']};
-                            border: 1px solid #cccccc;
-                            border-radius: 3px;
-                            padding: 4px;
-                            font-size: 9pt;
-                        }}
-                    """)
-                elif param_match:
-                    data_box.setStyleSheet(f"""
-                        QLineEdit {{
-                            background-color: {filter_colors['match_background']};
-                            color: {filter_colors['match_text']};
-                            border: {filter_colors['match_border']};
-                            border-radius: 3px;
-                            padding: 4px;
-                            font-size: 9pt;
-                            font-weight: bold;
-                        }}
-                    """)
+        # Apply colors to each data box independently, repainting the group once
+        data_group = window.data_tab._data_group
+        data_group.setUpdatesEnabled(False)
+        try:
+            for i, data_box in enumerate(window.data_tab.data_boxes):
+                if i < len(condition_strs):
+                    style_key = self._filter_style_key(condition_strs[i], param_matches[i])
                 else:
-                    
-                    data_box.setStyleSheet(f"""
-                        QLineEdit {{
-                            background-color: {filter_colors['no_match_background']};
-                            color: {filter_colors['no_match_text']};
-                            border: {filter_colors['no_match_border']};
-                            border-radius: 3px;
-                            padding: 4px;
-                            font-size: 9pt;
-                            font-weight: bold;
-                        }}
-                    """)
-            else:
-               
-                data_box.setStyleSheet(f"""
-                    QLineEdit {{
-                        background-color: {filter_colors['default_background']};
-                        color: {filter_colors['default_text']};
-                        border: 1px solid #cccccc;
-                        border-radius: 3px;
-                        padding: 4px;
-                        font-size: 9pt;
-                    }}
-                """)
+                    style_key = 'default'
+            
+                window.data_tab.set_filter_state(data_box, style_key)
+        finally:
+            data_group.setUpdatesEnabled(True)
 
     def get_independent_parameter_colors(self, window, site, specimen):
         """Get color information for each parameter independently"""
-        if not hasattr(window.data_tab, 'test_data_generator'):
+        if not self._has_test_data:
             return {}
         
         test_data = window.data_tab.test_data_generator
-        
-        # Get current range settings
-        try:
-            range_up = int(window.data_tab.range_up_combo.currentText())
-            range_down = int(window.data_tab.range_down_combo.currentText())
-        except (ValueError, AttributeError):
-            range_up = 100
-            range_down = 1
+        range_up, range_down = window.data_tab.get_range()
         
         # Get filter conditions
         filter_conditions = []
@@ -823,6 +706,22 @@ class TestAppManager:
             else:
                 filter_conditions.append("")
         
+        if not any(filter_conditions):
+            return {
+                param_label: {
+                    'background': 'white',
+                    'text': 'black',
+                    'match': True,
+                    'reason': 'No condition specified'
+                }
+                for param_label in test_data.parameter_labels
+            }
+        
+        # Check all parameter conditions in one pass
+        param_matches = test_data.check_all_parameter_conditions(
+            site, specimen, filter_conditions, range_up, range_down
+        )
+        
         # Calculate color for each parameter independently
         parameter_colors = {}
         
@@ -839,12 +738,7 @@ class TestAppManager:
                         'reason': 'No condition specified'
                     }
                 else:
-                    # Check condition independently
-                    param_match = test_data.check_parameter_condition_independently(
-                        site, specimen, i, condition_str, range_up, range_down
-                    )
-                    
-                    if param_match:
+                    if param_matches[i]:
                         # Condition met
                         parameter_colors[param_label] = {
                             'background': 'lightgreen',
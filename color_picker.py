@@ -1,12 +1,113 @@
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton, 
-    QListWidget, QListWidgetItem, QColorDialog, QSpinBox, QLineEdit, 
+    QListView, QColorDialog, QSpinBox, QLineEdit, 
     QGridLayout, QGroupBox, QSlider, QTabWidget, QWidget, QScrollArea, 
     QSizePolicy
 )
-from PySide6.QtGui import QColor, QPainter
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QColor, QPainter, QImage, QPixmap, QIcon, QPen
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QSignalBlocker, QAbstractListModel, QModelIndex, QPoint
 import colorsys
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache
+import numpy as np
+from config import LayoutConfig
+
+# Two-digit hex for every byte value, used to build '#rrggbb' strings
+_HEX = tuple(f"{i:02x}" for i in range(256))
+
+
+def _hsv_to_rgb_array(hue, sat, val):
+    """
+    Vectorized integer colorsys.hsv_to_rgb for a scalar hue over saturation/value arrays
+    
+    Args:
+        hue (float): Hue in [0, 1]
+        sat (np.ndarray): uint16 saturation values in [0, 255], shape (1, width)
+        val (np.ndarray): uint16 brightness values in [0, 255], shape (height, 1)
+        
+    Returns:
+        np.ndarray: C-contiguous uint8 array of shape (height, width, 3)
+    """
+    # Same sector formula as colorsys in 8-bit fixed point (within 2 levels of it);
+    # the hue is scalar so only one sector applies and every product fits in uint16
+    i = int(hue * 6.0)
+    f = int((hue * 6.0 - i) * 256)
+    p = val * (255 - sat) // 255
+    q = val * (255 - sat * f // 256) // 255
+    t = val * (255 - sat * (256 - f) // 256) // 255
+    v = val
+    channels = ((v, t, p), (q, v, p), (p, v, t), (p, q, v), (t, p, v), (v, p, q))[i % 6]
+    rgb = np.empty((val.shape[0], sat.shape[1], 3), dtype=np.uint8)
+    for k, channel in enumerate(channels):
+        rgb[..., k] = channel
+    return rgb
+
+
+def _rgb_to_hsv(r, g, b):
+    """colorsys.rgb_to_hsv with the per-channel distance terms folded into one difference"""
+    maxc = max(r, g, b)
+    minc = min(r, g, b)
+    if minc == maxc:
+        return 0.0, 0.0, maxc
+    rangec = maxc - minc
+    if r == maxc:
+        h = (g - b) / rangec
+    elif g == maxc:
+        h = 2.0 + (b - r) / rangec
+    else:
+        h = 4.0 + (r - g) / rangec
+    return (h / 6.0) % 1.0, rangec / maxc, maxc
+
+
+# Quick color presets shown by ColorPaletteWidget, 6 per row
+_PRESET_COLORS = (
+    '#FF0000', '#00FF00', '#0000FF', '#FFFF00', '#FF00FF', '#00FFFF',
+    '#800000', '#008000', '#000080', '#808000', '#800080', '#008080',
+    '#FFA500', '#FFC0CB', '#A52A2A', '#808080', '#000000', '#FFFFFF'
+)
+
+# Color preview button stylesheet with only the color left to fill in
+_PREVIEW_STYLE = LayoutConfig.COLOR_PICKER_STYLES['color_preview']
+_PREVIEW_TEMPLATE = """
+    QPushButton {{
+        background-color: {color};
+        border: %s;
+        border-radius: %s;
+    }}
+""" % (_PREVIEW_STYLE['border'], _PREVIEW_STYLE['border_radius'])
+
+
+def _set_spin(spin, value):
+    """Set a spin box value without emitting signals, skipping unchanged values"""
+    if spin.value() != value:
+        with QSignalBlocker(spin):
+            spin.setValue(value)
+
+
+def _set_text(line_edit, text):
+    """Set a line edit's text without emitting signals, skipping unchanged text"""
+    if line_edit.text() != text:
+        with QSignalBlocker(line_edit):
+            line_edit.setText(text)
+
+
+@lru_cache(maxsize=256)
+def _hex_to_hsv(text):
+    """
+    Parse a '#rrggbb' string into HSV and RGB components, cached per string
+    
+    Args:
+        text (str): Hex color string
+        
+    Returns:
+        tuple: (h, s, v, r, g, b) as floats in [0, 1]
+    """
+    r = int(text[1:3], 16) / 255.0
+    g = int(text[3:5], 16) / 255.0
+    b = int(text[5:7], 16) / 255.0
+    h, s, v = _rgb_to_hsv(r, g, b)
+    return h, s, v, r, g, b
 
 
 class ColorPickerArea(QWidget):
@@ -19,9 +120,23 @@ class ColorPickerArea(QWidget):
         self.current_hue = 0.5
         self.current_sat = 1.0
         self.current_val = 1.0
+        # Saturation grows along x, value falls down y
+        self._sat = np.arange(256, dtype=np.uint16)[None, :]
+        self._val = ((1.0 - np.arange(128) / 127.0) * 255).astype(np.uint16)[:, None]
+        # Gradient image for current_hue, rebuilt on the next paint after a hue change
+        self._sv_cache = None
+        self._sv_buffer = None
+        # Coalesce drag moves to at most one update per frame
+        self._pending_pos = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._apply_pending_position)
         
     def set_hue(self, hue):
         """Set hue value"""
+        if hue != self.current_hue:
+            self._sv_cache = None
         self.current_hue = hue
         self.update()
         
@@ -35,16 +150,12 @@ class ColorPickerArea(QWidget):
         """Paint the color area with saturation-value gradient"""
         painter = QPainter(self)
         
-        # Draw saturation-value gradient
-        for x in range(256):
-            for y in range(128):
-                sat = x / 255.0
-                val = 1.0 - (y / 127.0)
-                
-                r, g, b = colorsys.hsv_to_rgb(self.current_hue, sat, val)
-                color = QColor(int(r * 255), int(g * 255), int(b * 255))
-                painter.setPen(color)
-                painter.drawPoint(x, y)
+        # Draw saturation-value gradient, cached per hue
+        if self._sv_cache is None:
+            # QImage does not copy the buffer, so keep the array alive alongside it
+            self._sv_buffer = _hsv_to_rgb_array(self.current_hue, self._sat, self._val)
+            self._sv_cache = QImage(self._sv_buffer.data, 256, 128, 256 * 3, QImage.Format.Format_RGB888)
+        painter.drawImage(0, 0, self._sv_cache)
         
         # Draw current position marker
         x = int(self.current_sat * 255)
@@ -63,7 +174,22 @@ class ColorPickerArea(QWidget):
     def mouseMoveEvent(self, event):
         """Handle mouse move events"""
         if event.buttons() & Qt.MouseButton.LeftButton:
-            self.update_color_from_position(event.position().toPoint())
+            self._pending_pos = event.position().toPoint()
+            if not self._move_timer.isActive():
+                self._move_timer.start()
+            
+    def mouseReleaseEvent(self, event):
+        """Apply the last coalesced drag position on release"""
+        if self._move_timer.isActive():
+            self._move_timer.stop()
+            self._apply_pending_position()
+            
+    @Slot()
+    def _apply_pending_position(self):
+        """Apply the most recent drag position"""
+        if self._pending_pos is not None:
+            pos, self._pending_pos = self._pending_pos, None
+            self.update_color_from_position(pos)
             
     def update_color_from_position(self, pos):
         """Update color based on mouse position"""
@@ -88,10 +214,37 @@ class HueBar(QWidget):
     # Define signals
     hue_changed = Signal(float)  # hue
     
+    # Hue gradient is the same for every bar; built once on first use
+    _strip = None
+    
     def __init__(self, parent):
         super().__init__(parent)
         self.setFixedSize(256, 20)
         self.current_hue = 0.5
+        if HueBar._strip is None:
+            HueBar._strip = self._build_strip()
+        # Coalesce drag moves to at most one update per frame
+        self._pending_pos = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._apply_pending_position)
+        
+    @staticmethod
+    def _build_strip():
+        """Build the 256x20 full-saturation hue gradient pixmap"""
+        hue = np.arange(256) / 255.0
+        sector = (hue * 6.0).astype(int) % 6
+        f = hue * 6.0 - (hue * 6.0).astype(int)
+        # colorsys sectors with sat = val = 1: p = 0, q = 1 - f, t = 1 - (1 - f)
+        one, zero, q, t = np.ones(256), np.zeros(256), 1.0 - f, 1.0 - (1.0 - f)
+        r = np.choose(sector, (one, q, zero, zero, t, one))
+        g = np.choose(sector, (t, one, one, q, zero, zero))
+        b = np.choose(sector, (zero, zero, t, one, one, q))
+        row = (np.stack((r, g, b), axis=-1) * 255).astype(np.uint8)
+        rgb = np.ascontiguousarray(np.broadcast_to(row, (20, 256, 3)))
+        # fromImage copies the pixels, so the buffer may be released afterwards
+        return QPixmap.fromImage(QImage(rgb.data, 256, 20, 256 * 3, QImage.Format.Format_RGB888))
         
     def set_hue(self, hue):
         """Set hue value"""
@@ -103,12 +256,7 @@ class HueBar(QWidget):
         painter = QPainter(self)
         
         # Draw hue gradient
-        for x in range(256):
-            hue = x / 255.0
-            r, g, b = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-            color = QColor(int(r * 255), int(g * 255), int(b * 255))
-            painter.setPen(color)
-            painter.drawLine(x, 0, x, 20)
+        painter.drawPixmap(0, 0, HueBar._strip)
         
         # Draw current position marker
         x = int(self.current_hue * 255)
@@ -126,7 +274,22 @@ class HueBar(QWidget):
     def mouseMoveEvent(self, event):
         """Handle mouse move events"""
         if event.buttons() & Qt.MouseButton.LeftButton:
-            self.update_hue_from_position(event.position().toPoint())
+            self._pending_pos = event.position().toPoint()
+            if not self._move_timer.isActive():
+                self._move_timer.start()
+            
+    def mouseReleaseEvent(self, event):
+        """Apply the last coalesced drag position on release"""
+        if self._move_timer.isActive():
+            self._move_timer.stop()
+            self._apply_pending_position()
+            
+    @Slot()
+    def _apply_pending_position(self):
+        """Apply the most recent drag position"""
+        if self._pending_pos is not None:
+            pos, self._pending_pos = self._pending_pos, None
+            self.update_hue_from_position(pos)
             
     def update_hue_from_position(self, pos):
         """Update hue based on mouse position"""
@@ -151,6 +314,9 @@ class GradientColorPicker(QWidget):
         self.current_sat = 1.0  # Current saturation (0-1)
         self.current_val = 1.0  # Current value (0-1)
         self.color_changed_callback = None
+        
+        self._last_preview_color = None
+        
         self.setFixedSize(300, 280)
         self.create_ui()
         
@@ -228,24 +394,14 @@ class GradientColorPicker(QWidget):
         r, g, b = colorsys.hsv_to_rgb(self.current_hue, self.current_sat, self.current_val)
         r, g, b = int(r * 255), int(g * 255), int(b * 255)
         
-        self.r_spin.blockSignals(True)
-        self.g_spin.blockSignals(True)
-        self.b_spin.blockSignals(True)
-        
-        self.r_spin.setValue(r)
-        self.g_spin.setValue(g)
-        self.b_spin.setValue(b)
+        _set_spin(self.r_spin, r)
+        _set_spin(self.g_spin, g)
+        _set_spin(self.b_spin, b)
         
-        self.r_spin.blockSignals(False)
-        self.g_spin.blockSignals(False)
-        self.b_spin.blockSignals(False)
-        
-        hex_color = f"#{r:02x}{g:02x}{b:02x}"
+        hex_color = "#" + _HEX[r] + _HEX[g] + _HEX[b]
         self.current_color = hex_color
         
-        self.color_input.blockSignals(True)
-        self.color_input.setText(hex_color)
-        self.color_input.blockSignals(False)
+        _set_text(self.color_input, hex_color)
         
         self.update_color_preview()
         
@@ -254,11 +410,12 @@ class GradientColorPicker(QWidget):
             
     def on_rgb_changed(self):
         """Handle RGB value changes"""
-        r = self.r_spin.value() / 255.0
-        g = self.g_spin.value() / 255.0
-        b = self.b_spin.value() / 255.0
+        r_byte, g_byte, b_byte = self.r_spin.value(), self.g_spin.value(), self.b_spin.value()
+        r = r_byte / 255.0
+        g = g_byte / 255.0
+        b = b_byte / 255.0
         
-        h, s, v = colorsys.rgb_to_hsv(r, g, b)
+        h, s, v = _rgb_to_hsv(r, g, b)
         
         self.current_hue = h
         self.current_sat = s
@@ -268,12 +425,10 @@ class GradientColorPicker(QWidget):
         self.color_area.set_hue(h)
         self.color_area.set_position(s, v)
         
-        hex_color = f"#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}"
+        hex_color = "#" + _HEX[r_byte] + _HEX[g_byte] + _HEX[b_byte]
         self.current_color = hex_color
         
-        self.color_input.blockSignals(True)
-        self.color_input.setText(hex_color)
-        self.color_input.blockSignals(False)
+        _set_text(self.color_input, hex_color)
         
         self.update_color_preview()
         
@@ -284,11 +439,7 @@ class GradientColorPicker(QWidget):
         """Handle color input text changes"""
         try:
             if text.startswith('#') and len(text) == 7:
-                r = int(text[1:3], 16) / 255.0
-                g = int(text[3:5], 16) / 255.0
-                b = int(text[5:7], 16) / 255.0
-                
-                h, s, v = colorsys.rgb_to_hsv(r, g, b)
+                h, s, v, r, g, b = _hex_to_hsv(text)
                 
                 self.current_hue = h
                 self.current_sat = s
@@ -299,17 +450,9 @@ class GradientColorPicker(QWidget):
                 self.color_area.set_hue(h)
                 self.color_area.set_position(s, v)
                 
-                self.r_spin.blockSignals(True)
-                self.g_spin.blockSignals(True)
-                self.b_spin.blockSignals(True)
-                
-                self.r_spin.setValue(int(r * 255))
-                self.g_spin.setValue(int(g * 255))
-                self.b_spin.setValue(int(b * 255))
-                
-                self.r_spin.blockSignals(False)
-                self.g_spin.blockSignals(False)
-                self.b_spin.blockSignals(False)
+                _set_spin(self.r_spin, int(r * 255))
+                _set_spin(self.g_spin, int(g * 255))
+                _set_spin(self.b_spin, int(b * 255))
                 
                 self.update_color_preview()
                 
@@ -319,17 +462,11 @@ class GradientColorPicker(QWidget):
             pass
             
     def update_color_preview(self):
-        """Update the color preview button"""
-        from config import LayoutConfig
-        
-        preview_style = LayoutConfig.COLOR_PICKER_STYLES['color_preview']
-        self.color_preview.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.current_color};
-                border: {preview_style['border']};
-                border-radius: {preview_style['border_radius']};
-            }}
-        """)
+        """Update the color preview button, skipping colors already applied"""
+        if self.current_color == self._last_preview_color:
+            return
+        self._last_preview_color = self.current_color
+        self.color_preview.setStyleSheet(_PREVIEW_TEMPLATE.format(color=self.current_color))
         
     def open_color_dialog(self):
         """Open system color dialog"""
@@ -373,35 +510,32 @@ class ColorPaletteWidget(QWidget):
         preset_layout.setSpacing(2)
         preset_layout.setContentsMargins(5, 5, 5, 5)
         
-        # Common colors
-        preset_colors = [
-            '#FF0000', '#00FF00', '#0000FF', '#FFFF00', '#FF00FF', '#00FFFF',
-            '#800000', '#008000', '#000080', '#808000', '#800080', '#008080',
-            '#FFA500', '#FFC0CB', '#A52A2A', '#808080', '#000000', '#FFFFFF'
-        ]
+        # Shared button look; each button only adds its own background color
+        preset_group.setStyleSheet("""
+            QPushButton[role="preset_color"] {
+                border: 1px solid #666;
+                border-radius: 2px;
+                margin: 0px;
+                padding: 0px;
+            }
+            QPushButton[role="preset_color"]:hover {
+                border: 2px solid #333;
+                border-radius: 2px;
+            }
+            QPushButton[role="preset_color"]:pressed {
+                border: 2px solid #000;
+                border-radius: 1px;
+            }
+        """)
         
         row, col = 0, 0
-        for color in preset_colors:
+        for color in _PRESET_COLORS:
             color_btn = QPushButton()
             color_btn.setFixedSize(18, 18)
-            color_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {color};
-                    border: 1px solid #666;
-                    border-radius: 2px;
-                    margin: 0px;
-                    padding: 0px;
-                }}
-                QPushButton:hover {{
-                    border: 2px solid #333;
-                    border-radius: 2px;
-                }}
-                QPushButton:pressed {{
-                    border: 2px solid #000;
-                    border-radius: 1px;
-                }}
-            """)
-            color_btn.clicked.connect(lambda checked, c=color: self.set_color(c))
+            color_btn.setProperty("role", "preset_color")
+            color_btn.setProperty("preset_color", color)
+            color_btn.setStyleSheet(f"background-color: {color};")
+            color_btn.clicked.connect(self._on_preset_clicked)
             preset_layout.addWidget(color_btn, row, col)
             
             col += 1
@@ -412,6 +546,11 @@ class ColorPaletteWidget(QWidget):
         preset_group.setLayout(preset_layout)
         layout.addWidget(preset_group)
         
+    @Slot()
+    def _on_preset_clicked(self):
+        """Select the preset color stored on the clicked button"""
+        self.set_color(self.sender().property("preset_color"))
+        
     def on_gradient_color_changed(self, color):
         """Handle gradient picker color changes"""
         self.current_color = color
@@ -433,6 +572,17 @@ class ColorPaletteWidget(QWidget):
 class PlotObjectStyleDialog(QDialog):
     """Plot object style adjustment dialog - resizable with scroll bars"""
     
+    # Matplotlib style options as (display name, code)
+    LINE_STYLES = (
+        ('Solid', '-'), ('Dashed', '--'), ('Dash-dot', '-.'), ('Dotted', ':'), ('None', 'None')
+    )
+    MARKERS = (
+        ('Circle', 'o'), ('Square', 's'), ('Triangle Up', '^'), ('Triangle Down', 'v'),
+        ('Triangle Left', '<'), ('Triangle Right', '>'), ('Diamond', 'D'), ('Pentagon', 'p'),
+        ('Star', '*'), ('Hexagon1', 'h'), ('Hexagon2', 'H'), ('Plus', '+'), ('X', 'x'),
+        ('Vertical Line', '|'), ('Horizontal Line', '_'), ('Point', '.'), ('Pixel', ','), ('None', 'None')
+    )
+    
     def __init__(self, parent, object_info, style_changed_callback=None):
         super().__init__(parent)
         self.object_info = object_info
@@ -448,15 +598,6 @@ class PlotObjectStyleDialog(QDialog):
         self.resize(500, 500)
         self.setMinimumSize(300, 400)
         
-        # Matplotlib style options
-        self.line_styles = ['-', '--', '-.', ':', 'None']
-        self.line_style_names = ['Solid', 'Dashed', 'Dash-dot', 'Dotted', 'None']
-        
-        self.markers = ['o', 's', '^', 'v', '<', '>', 'D', 'p', '*', 'h', 'H', '+', 'x', '|', '_', '.', ',', 'None']
-        self.marker_names = ['Circle', 'Square', 'Triangle Up', 'Triangle Down', 'Triangle Left', 'Triangle Right', 
-                           'Diamond', 'Pentagon', 'Star', 'Hexagon1', 'Hexagon2', 'Plus', 'X', 'Vertical Line', 
-                           'Horizontal Line', 'Point', 'Pixel', 'None']
-        
         self.create_ui()
         
     def create_ui(self):
@@ -489,13 +630,14 @@ class PlotObjectStyleDialog(QDialog):
         line_tab = self.create_line_style_tab()
         tab_widget.addTab(line_tab, "Line Style")
         
-        # Marker style tab
-        marker_tab = self.create_marker_style_tab()
-        tab_widget.addTab(marker_tab, "Marker Style")
-        
-        # Color tab
-        color_tab = self.create_color_tab()
-        tab_widget.addTab(color_tab, "Colors")
+        # Marker style and color tabs start as placeholders, built on first activation
+        self._deferred_tabs = {}
+        for title, builder in (("Marker Style", self.create_marker_style_tab),
+                               ("Colors", self.create_color_tab)):
+            placeholder = QWidget()
+            QVBoxLayout(placeholder).setContentsMargins(0, 0, 0, 0)
+            self._deferred_tabs[tab_widget.addTab(placeholder, title)] = (placeholder, builder)
+        tab_widget.currentChanged.connect(self._build_tab)
         
         content_layout.addWidget(tab_widget)
         
@@ -518,6 +660,18 @@ class PlotObjectStyleDialog(QDialog):
         
         layout.addLayout(button_layout)
         
+    @Slot(int)
+    def _build_tab(self, index):
+        """Build a deferred tab into its placeholder the first time it is needed"""
+        if index in self._deferred_tabs:
+            placeholder, builder = self._deferred_tabs.pop(index)
+            placeholder.layout().addWidget(builder())
+            
+    def _build_all_tabs(self):
+        """Build any tabs not yet shown, so every style control exists"""
+        for index in list(self._deferred_tabs):
+            self._build_tab(index)
+        
     def create_line_style_tab(self):
         """Create line style settings tab"""
         tab = QWidget()
@@ -541,7 +695,7 @@ class PlotObjectStyleDialog(QDialog):
         
         style_layout.addWidget(QLabel("Style:"), 0, 0)
         self.line_style_combo = QComboBox()
-        for i, (style, name) in enumerate(zip(self.line_styles, self.line_style_names)):
+        for name, style in self.LINE_STYLES:
             self.line_style_combo.addItem(name, style)
         style_layout.addWidget(self.line_style_combo, 0, 1)
         
@@ -556,9 +710,12 @@ class PlotObjectStyleDialog(QDialog):
         self.line_alpha_slider.setRange(0, 100)
         self.line_alpha_slider.setValue(100)
         self.line_alpha_label = QLabel("1.0")
-        self.line_alpha_slider.valueChanged.connect(
-            lambda v: self.line_alpha_label.setText(f"{v/100:.1f}")
-        )
+        # Coalesce label updates while the slider is dragged
+        self._alpha_timer = QTimer(self)
+        self._alpha_timer.setSingleShot(True)
+        self._alpha_timer.setInterval(16)
+        self._alpha_timer.timeout.connect(self._update_alpha_label)
+        self.line_alpha_slider.valueChanged.connect(self._on_alpha_changed)
         alpha_layout = QHBoxLayout()
         alpha_layout.addWidget(self.line_alpha_slider)
         alpha_layout.addWidget(self.line_alpha_label)
@@ -579,6 +736,19 @@ class PlotObjectStyleDialog(QDialog):
         
         return tab
         
+    @Slot(int)
+    def _on_alpha_changed(self, value):
+        """Schedule one label update per frame while the slider moves"""
+        if not self._alpha_timer.isActive():
+            self._alpha_timer.start()
+            
+    @Slot()
+    def _update_alpha_label(self):
+        """Show the current line alpha value"""
+        text = f"{self.line_alpha_slider.value()/100:.1f}"
+        if self.line_alpha_label.text() != text:
+            self.line_alpha_label.setText(text)
+        
     def create_marker_style_tab(self):
         """Create marker style settings tab"""
         tab = QWidget()
@@ -602,7 +772,7 @@ class PlotObjectStyleDialog(QDialog):
         
         marker_layout.addWidget(QLabel("Marker:"), 0, 0)
         self.marker_combo = QComboBox()
-        for i, (marker, name) in enumerate(zip(self.markers, self.marker_names)):
+        for name, marker in self.MARKERS:
             self.marker_combo.addItem(name, marker)
         marker_layout.addWidget(self.marker_combo, 0, 1)
         
@@ -671,19 +841,11 @@ class PlotObjectStyleDialog(QDialog):
         self.color_picker_container = QWidget()
         self.color_picker_layout = QVBoxLayout(self.color_picker_container)
         
-        # Create three color pickers, but only show one at a time
-        self.line_color_palette = ColorPaletteWidget('blue')
-        self.marker_face_color_palette = ColorPaletteWidget('blue') 
-        self.marker_edge_color_palette = ColorPaletteWidget('black')
-        
-        # Add all color pickers to layout but hide them initially
-        self.color_picker_layout.addWidget(self.line_color_palette)
-        self.color_picker_layout.addWidget(self.marker_face_color_palette)
-        self.color_picker_layout.addWidget(self.marker_edge_color_palette)
-        
-        # Initially show line color picker
-        self.marker_face_color_palette.hide()
-        self.marker_edge_color_palette.hide()
+        # One color picker shared by all color types; each type keeps its own color
+        self._role_colors = {'line': 'blue', 'marker_face': 'blue', 'marker_edge': 'black'}
+        self._current_role = 'line'
+        self.color_palette = ColorPaletteWidget(self._role_colors['line'])
+        self.color_picker_layout.addWidget(self.color_palette)
         
         color_type_layout.addWidget(self.color_picker_container)
         color_type_group.setLayout(color_type_layout)
@@ -716,10 +878,13 @@ class PlotObjectStyleDialog(QDialog):
         current_color_group.setLayout(current_color_layout)
         layout.addWidget(current_color_group)
         
-        # Connect color change callbacks
-        self.line_color_palette.color_changed_callback = self.on_line_color_changed
-        self.marker_face_color_palette.color_changed_callback = self.on_marker_face_color_changed
-        self.marker_edge_color_palette.color_changed_callback = self.on_marker_edge_color_changed
+        # Route picker changes to the preview of the selected color type
+        self._role_previews = {
+            'line': self.line_color_preview,
+            'marker_face': self.marker_face_preview,
+            'marker_edge': self.marker_edge_preview,
+        }
+        self.color_palette.color_changed_callback = self.on_role_color_changed
         
         layout.addStretch()
         
@@ -735,35 +900,18 @@ class PlotObjectStyleDialog(QDialog):
     
     def on_color_type_changed(self, index):
         """Handle color type selection changes"""
-        color_type = self.color_type_combo.currentData()
-        
-        # Hide all color pickers
-        self.line_color_palette.hide()
-        self.marker_face_color_palette.hide()
-        self.marker_edge_color_palette.hide()
-        
-        # Show selected color picker
-        if color_type == "line":
-            self.line_color_palette.show()
-        elif color_type == "marker_face":
-            self.marker_face_color_palette.show()
-        elif color_type == "marker_edge":
-            self.marker_edge_color_palette.show()
+        # Switch the shared picker to the selected type's color
+        self._current_role = self.color_type_combo.currentData()
+        self.color_palette.set_color(self._role_colors[self._current_role])
     
-    def on_line_color_changed(self, color):
-        """Handle line color changes"""
-        self.line_color_preview.setStyleSheet(f"background-color: {color}; border: 1px solid black;")
-        
-    def on_marker_face_color_changed(self, color):
-        """Handle marker face color changes"""
-        self.marker_face_preview.setStyleSheet(f"background-color: {color}; border: 1px solid black;")
-        
-    def on_marker_edge_color_changed(self, color):
-        """Handle marker edge color changes"""
-        self.marker_edge_preview.setStyleSheet(f"background-color: {color}; border: 1px solid black;")
+    def on_role_color_changed(self, color):
+        """Handle picker color changes for the selected color type"""
+        self._role_colors[self._current_role] = color
+        self._role_previews[self._current_role].setStyleSheet(f"background-color: {color}; border: 1px solid black;")
         
     def get_current_style(self):
         """Get current style settings"""
+        self._build_all_tabs()
         return {
             'linestyle': self.line_style_combo.currentData(),
             'linewidth': self.line_width_spin.value(),
@@ -771,9 +919,9 @@ class PlotObjectStyleDialog(QDialog):
             'marker': self.marker_combo.currentData(),
             'markersize': self.marker_size_spin.value(),
             'markeredgewidth': self.marker_edge_width_spin.value(),
-            'color': self.line_color_palette.get_color(),
-            'markerfacecolor': self.marker_face_color_palette.get_color(),
-            'markeredgecolor': self.marker_edge_color_palette.get_color()
+            'color': self._role_colors['line'],
+            'markerfacecolor': self._role_colors['marker_face'],
+            'markeredgecolor': self._role_colors['marker_edge']
         }
         
     def apply_style(self):
@@ -783,12 +931,185 @@ class PlotObjectStyleDialog(QDialog):
             self.style_changed_callback(self.object_info, style)
 
 
+# Label/text string per plot artist, reused across list dialog opens;
+# entries go away with their artist, so ids are never reused stale
+_LABEL_CACHE = weakref.WeakKeyDictionary()
+
+
+def _artist_text(artist, getter):
+    """Return artist.<getter>() (get_label or get_text), cached per artist"""
+    text = _LABEL_CACHE.get(artist)
+    if text is None:
+        text = _LABEL_CACHE[artist] = getattr(artist, getter)()
+    return text
+
+
+# Style keys each plot object type accepts, mapped to the artist property Artist.update sets
+_LINE_PROPS = {key: key for key in (
+    'color', 'linestyle', 'linewidth', 'alpha', 'marker', 'markersize',
+    'markerfacecolor', 'markeredgecolor', 'markeredgewidth'
+)}
+_COLLECTION_PROPS = {'color': 'facecolors', 'alpha': 'alpha'}
+_TEXT_PROPS = {'color': 'color', 'alpha': 'alpha'}
+_STYLE_PROPS = {'line': _LINE_PROPS, 'collection': _COLLECTION_PROPS, 'text': _TEXT_PROPS}
+
+
+# Plot object list dialog stylesheet, set once on the dialog; selectors are scoped
+# by object name so they do not cascade into the child style dialog
+_OBJECT_LIST_STYLE = """
+    QLabel#objectListInfo {
+        font-weight: bold;
+        margin: 10px 0;
+    }
+    QListView#objectList {
+        background-color: #f8f8f8;
+        border: 1px solid #ccc;
+        border-radius: 5px;
+        padding: 5px;
+        font-size: 12px;
+    }
+    QListView#objectList::item {
+        padding: 8px;
+        border-bottom: 1px solid #eee;
+        border-radius: 3px;
+        margin: 2px;
+    }
+    QListView#objectList::item:selected {
+        background-color: #e0e0e0;
+        color: #000;
+    }
+    QListView#objectList::item:hover {
+        background-color: #f0f0f0;
+    }
+    QPushButton#objectListClose {
+        background-color: #e8e8e8;
+        border: 1px solid #ccc;
+        border-radius: 5px;
+        padding: 8px 16px;
+        font-weight: bold;
+        min-width: 80px;
+    }
+    QPushButton#objectListClose:hover {
+        background-color: #d8d8d8;
+    }
+    QPushButton#objectListClose:pressed {
+        background-color: #c8c8c8;
+    }
+"""
+
+
+@lru_cache(maxsize=None)
+def _object_icon(obj_type):
+    """Small icon for a plot object type, drawn once (needs a running QApplication)"""
+    pixmap = QPixmap(16, 16)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    if obj_type == 'line':
+        painter.setPen(QPen(QColor('#3070c0'), 2))
+        painter.drawPolyline([QPoint(1, 13), QPoint(6, 6), QPoint(10, 10), QPoint(15, 2)])
+    elif obj_type == 'collection':
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor('#c03030'))
+        painter.drawEllipse(3, 3, 10, 10)
+    else:
+        painter.setPen(QColor('#606060'))
+        font = painter.font()
+        font.setBold(True)
+        font.setPixelSize(14)
+        painter.setFont(font)
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "T")
+    painter.end()
+    return QIcon(pixmap)
+
+
+# Axes accessor for each plot object type; rows refer to artists as (type, index)
+_ARTIST_ACCESSORS = {
+    'line': lambda ax: ax.lines,
+    'collection': lambda ax: ax.collections,
+    'text': lambda ax: ax.texts,
+}
+
+
+def _object_label(obj_type, obj, index):
+    """Display label for a plot object"""
+    if obj_type == 'line':
+        label = _artist_text(obj, 'get_label')
+        if not label or label.startswith('_'):
+            label = f"Line {index+1}"
+    elif obj_type == 'collection':
+        label = f"Scatter {index+1}"
+    else:
+        label = _artist_text(obj, 'get_text')
+        label = label[:20] + "..." if len(label) > 20 else label
+        if not label.strip():
+            label = f"Text {index+1}"
+    return label
+
+
+class ArtistListModel(QAbstractListModel):
+    """
+    List model of plot objects with a per-type icon
+    
+    Rows are (type, index) handles into the axes, so the model holds no
+    artist references; labels are resolved the first time the view asks
+    for a row, and artists when an object is picked for editing
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ax = None
+        self._rows = []
+        self._labels = {}
+        
+    def set_rows(self, ax, rows):
+        """Replace all rows with (type, index) handles into ax"""
+        self.beginResetModel()
+        self._ax = ax
+        self._rows = rows
+        self._labels = {}
+        self.endResetModel()
+        
+    def artist(self, row):
+        """Resolve the artist behind a row"""
+        obj_type, index = self._rows[row]
+        return _ARTIST_ACCESSORS[obj_type](self._ax)[index]
+        
+    def label(self, row):
+        """Display label for a row, computed once"""
+        label = self._labels.get(row)
+        if label is None:
+            obj_type, index = self._rows[row]
+            label = self._labels[row] = _object_label(obj_type, self.artist(row), index)
+        return label
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.label(row)
+        if role == Qt.ItemDataRole.DecorationRole:
+            return _object_icon(self._rows[row][0])
+        if role == Qt.ItemDataRole.UserRole:
+            return self._rows[row]
+        return None
+
+
 class PlotObjectListDialog(QDialog):
     """Plot object list dialog - resizable with scroll bars"""
     
     def __init__(self, parent, plot_info):
         super().__init__(parent)
         self.plot_info = plot_info
+        # Nesting depth of batched_updates() and whether a redraw was deferred
+        self._batch_depth = 0
+        self._needs_draw = False
+        # Set while a style dialog is open so repeated activations don't stack dialogs
+        self._editing = False
         self.setWindowTitle(f"Plot Objects - {plot_info['title']}")
         self.setModal(True)
         
@@ -805,54 +1126,33 @@ class PlotObjectListDialog(QDialog):
         
     def create_ui(self):
         """Create the user interface"""
+        # One stylesheet for the whole dialog
+        self.setStyleSheet(_OBJECT_LIST_STYLE)
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
         layout.setSpacing(10)
         
         # Information label
         info_label = QLabel(f"Select an object to modify its style:")
-        info_label.setStyleSheet("font-weight: bold; margin: 10px 0;")
+        info_label.setObjectName("objectListInfo")
         layout.addWidget(info_label)
         
-        # Create scroll area containing object list
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        
-        # Object list
-        self.object_list = QListWidget()
-        self.object_list.itemDoubleClicked.connect(self.on_object_selected)
+        # Object list, rows are served by the model on demand
+        self.object_model = ArtistListModel(self)
+        self.object_list = QListView()
+        self.object_list.setObjectName("objectList")
+        self.object_list.setModel(self.object_model)
+        self.object_list.setUniformItemSizes(True)
+        self.object_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.object_list.setBatchSize(256)
+        self.object_list.activated.connect(self.on_object_selected)
         self.object_list.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.object_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.object_list.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         
-        # Set list styling
-        self.object_list.setStyleSheet("""
-            QListWidget {
-                background-color: #f8f8f8;
-                border: 1px solid #ccc;
-                border-radius: 5px;
-                padding: 5px;
-                font-size: 12px;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #eee;
-                border-radius: 3px;
-                margin: 2px;
-            }
-            QListWidget::item:selected {
-                background-color: #e0e0e0;
-                color: #000;
-            }
-            QListWidget::item:hover {
-                background-color: #f0f0f0;
-            }
-        """)
-        
-        # Put list in scroll area
-        scroll_area.setWidget(self.object_list)
-        layout.addWidget(scroll_area)
+        # The list view scrolls itself
+        layout.addWidget(self.object_list)
         
         # Button area (fixed at bottom)
         button_layout = QHBoxLayout()
@@ -861,26 +1161,7 @@ class PlotObjectListDialog(QDialog):
         close_btn = QPushButton("Close")
         close_btn.clicked.connect(self.close)
         close_btn.setMinimumHeight(35)
-        
-        # Set button styling
-        button_style = """
-            QPushButton {
-                background-color: #e8e8e8;
-                border: 1px solid #ccc;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-weight: bold;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #d8d8d8;
-            }
-            QPushButton:pressed {
-                background-color: #c8c8c8;
-            }
-        """
-        
-        close_btn.setStyleSheet(button_style)
+        close_btn.setObjectName("objectListClose")
         
         button_layout.addStretch()
         button_layout.addWidget(close_btn)
@@ -888,111 +1169,74 @@ class PlotObjectListDialog(QDialog):
         layout.addLayout(button_layout)
         
     def populate_objects(self):
-        """Populate the object list with plot elements"""
-        self.object_list.clear()
-        
+        """Populate the object list with plot elements; labels are resolved when rows are shown"""
         # Get all objects from the plot area
         canvas = self.plot_info['canvas']
         ax = canvas.ax
         
-        # Add line objects
-        for i, line in enumerate(ax.get_lines()):
-            label = line.get_label() if line.get_label() and not line.get_label().startswith('_') else f"Line {i+1}"
-            item = QListWidgetItem(f"📈 {label}")
-            item.setData(Qt.ItemDataRole.UserRole, {
-                'type': 'line',
-                'object': line,
-                'label': label,
-                'index': i
-            })
-            self.object_list.addItem(item)
-        
-        # Add scatter plot objects
-        for i, collection in enumerate(ax.collections):
-            label = f"Scatter {i+1}"
-            item = QListWidgetItem(f"🔴 {label}")
-            item.setData(Qt.ItemDataRole.UserRole, {
-                'type': 'collection',
-                'object': collection,
-                'label': label,
-                'index': i
-            })
-            self.object_list.addItem(item)
-        
-        # Add text objects
-        for i, text in enumerate(ax.texts):
-            label = text.get_text()[:20] + "..." if len(text.get_text()) > 20 else text.get_text()
-            if not label.strip():
-                label = f"Text {i+1}"
-            item = QListWidgetItem(f"📝 {label}")
-            item.setData(Qt.ItemDataRole.UserRole, {
-                'type': 'text',
-                'object': text,
-                'label': label,
-                'index': i
-            })
-            self.object_list.addItem(item)
-        
-    def on_object_selected(self, item):
+        rows = [('line', i) for i in range(len(ax.lines))]
+        rows += [('collection', i) for i in range(len(ax.collections))]
+        rows += [('text', i) for i in range(len(ax.texts))]
+        
+        self.object_model.set_rows(ax, rows)
+        
+    def on_object_selected(self, index):
         """Handle object selection"""
-        self.edit_object(item)
+        self.edit_object(index)
             
-    def edit_object(self, item):
+    def edit_object(self, index):
         """Edit object style properties"""
-        object_info = item.data(Qt.ItemDataRole.UserRole)
-        
-        # Create style editing dialog
-        style_dialog = PlotObjectStyleDialog(
-            self, 
-            object_info, 
-            self.on_style_changed
-        )
-        style_dialog.exec()
-        
+        if self._editing:
+            return
+        self._editing = True
+        try:
+            # Resolve the row's artist now rather than holding it in the model
+            row = index.row()
+            obj_type, obj_index = index.data(Qt.ItemDataRole.UserRole)
+            object_info = {
+                'type': obj_type,
+                'object': self.object_model.artist(row),
+                'label': self.object_model.label(row),
+                'index': obj_index
+            }
+            
+            # Create style editing dialog
+            style_dialog = PlotObjectStyleDialog(
+                self, 
+                object_info, 
+                self.on_style_changed
+            )
+            style_dialog.exec()
+        finally:
+            self._editing = False
+        
+    @contextmanager
+    def batched_updates(self):
+        """Defer canvas redraws from style changes until the outermost batch exits"""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._needs_draw:
+                self._needs_draw = False
+                self.plot_info['canvas'].draw_idle()
+                
     def on_style_changed(self, object_info, style):
         """Handle style change events"""
         obj = object_info['object']
         obj_type = object_info['type']
-        
-        try:
-            if obj_type == 'line':
-                # Update line style properties
-                if 'color' in style:
-                    obj.set_color(style['color'])
-                if 'linestyle' in style:
-                    obj.set_linestyle(style['linestyle'])
-                if 'linewidth' in style:
-                    obj.set_linewidth(style['linewidth'])
-                if 'alpha' in style:
-                    obj.set_alpha(style['alpha'])
-                if 'marker' in style:
-                    obj.set_marker(style['marker'])
-                if 'markersize' in style:
-                    obj.set_markersize(style['markersize'])
-                if 'markerfacecolor' in style:
-                    obj.set_markerfacecolor(style['markerfacecolor'])
-                if 'markeredgecolor' in style:
-                    obj.set_markeredgecolor(style['markeredgecolor'])
-                if 'markeredgewidth' in style:
-                    obj.set_markeredgewidth(style['markeredgewidth'])
-                    
-            elif obj_type == 'collection':
-                # Update collection object style (scatter plots, etc.)
-                if 'color' in style:
-                    obj.set_facecolors(style['color'])
-                if 'alpha' in style:
-                    obj.set_alpha(style['alpha'])
-                    
-            elif obj_type == 'text':
-                # Update text style properties
-                if 'color' in style:
-                    obj.set_color(style['color'])
-                if 'alpha' in style:
-                    obj.set_alpha(style['alpha'])
-            
-            # Refresh the canvas
-            self.plot_info['canvas'].draw()
-            
-        except Exception as e:
-            # Handle any errors during style application
-            pass
\ No newline at end of file
+        _LABEL_CACHE.pop(obj, None)
+        
+        # Apply only the style keys this object type supports, in one batch;
+        # filtering up front means unsupported keys never reach a setter
+        props = _STYLE_PROPS.get(obj_type)
+        if not props:
+            return
+        obj.update({prop: style[key] for key, prop in props.items() if key in style})
+        
+        # Schedule a canvas refresh; inside a batch it waits for the batch to end
+        if self._batch_depth:
+            self._needs_draw = True
+        else:
+            self.plot_info['canvas'].draw_idle()
\ No newline at end of file
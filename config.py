@@ -1,11 +1,60 @@
 """
 Layout Configuration Module - Centralized management of all UI layout parameters and styles
 """
+import re
+from functools import lru_cache, wraps
+
+
+def _cached_style(func):
+    """Memoize a LayoutConfig style getter (per arguments) in cls._style_cache until apply_theme clears it"""
+    @wraps(func)
+    def wrapper(cls, *args, **kwargs):
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        style = cls._style_cache.get(key)
+        if style is None:
+            style = cls._style_cache[key] = func(cls, *args, **kwargs)
+        return style
+    return wrapper
+
+
+_QSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_QSS_PUNCT_SPACE = re.compile(r'\s*([{};:,])\s*')
+_QSS_SPACE = re.compile(r'\s+')
+
+
+def _minify_qss(qss):
+    """Drop comments and insignificant whitespace from a stylesheet"""
+    qss = _QSS_COMMENT.sub('', qss)
+    qss = _QSS_PUNCT_SPACE.sub(r'\1', qss)
+    return _QSS_SPACE.sub(' ', qss).strip()
+
+
+@lru_cache(maxsize=4096)
+def _adaptive_font_size(text_len, available_width, base_font_size, min_font_size, max_font_size, scaling_factor):
+    """Font size for text of text_len characters; the ADAPTIVE_FONT values are part of the key"""
+    # Estimate text width (rough calculation)
+    char_width_ratio = 0.6  # Character width ratio
+    estimated_width = text_len * base_font_size * char_width_ratio
+    
+    if estimated_width <= available_width:
+        return min(base_font_size, max_font_size)
+    
+    # Calculate required font size
+    scale_factor = available_width / estimated_width
+    new_font_size = int(base_font_size * scale_factor * scaling_factor)
+    
+    return max(min_font_size, min(new_font_size, max_font_size))
 
 
 class LayoutConfig:
     """Layout configuration class - Centralized management of all UI layout parameters"""
     
+    # Generated stylesheets by getter name and arguments, cleared whenever the style dicts change
+    _style_cache = {}
+    
+    # Keep the global stylesheet readable (unminified) when debugging styles
+    DEBUG_STYLESHEET = False
+    
     # Main window configuration
     MAIN_WINDOW = {
         'title': 'Specimen Viewer',
@@ -292,6 +341,45 @@ class LayoutConfig:
         }
     }
     
+    # Data box filter state rules keyed on the filterState property, rendered once from filter_colors
+    STYLES['filter_qss'] = {
+        'default': f"""
+            QLineEdit[filterState="default"],
+            QLineEdit[filterState="default"]:read-only {{
+                background-color: {STYLES['filter_colors']['default_background']};
+                color: {STYLES['filter_colors']['default_text']};
+                border: 1px solid #cccccc;
+                border-radius: 3px;
+                padding: 4px;
+                font-size: 9pt;
+            }}
+        """,
+        'match': f"""
+            QLineEdit[filterState="match"],
+            QLineEdit[filterState="match"]:read-only {{
+                background-color: {STYLES['filter_colors']['match_background']};
+                color: {STYLES['filter_colors']['match_text']};
+                border: {STYLES['filter_colors']['match_border']};
+                border-radius: 3px;
+                padding: 4px;
+                font-size: 9pt;
+                font-weight: bold;
+            }}
+        """,
+        'no_match': f"""
+            QLineEdit[filterState="no_match"],
+            QLineEdit[filterState="no_match"]:read-only {{
+                background-color: {STYLES['filter_colors']['no_match_background']};
+                color: {STYLES['filter_colors']['no_match_text']};
+                border: {STYLES['filter_colors']['no_match_border']};
+                border-radius: 3px;
+                padding: 4px;
+                font-size: 9pt;
+                font-weight: bold;
+            }}
+        """
+    }
+    
     # Color configuration
     COLORS = {
         'plot_colors': [
@@ -301,98 +389,26 @@ class LayoutConfig:
     }
     
     # GroupBox style configuration - Unified control of all block borders and backgrounds
+    # Standard block style, shared by reference by every standard block below
+    _GROUPBOX_DEFAULT = {
+        'border': '1px solid #dddddd',
+        'border_radius': '3px',
+        'margin_top': '8px',
+        'padding_top': '8px',
+        'background_color': '#f5f5f5',  # Light gray background
+        'title_color': '#333333',
+        'title_font_weight': 'bold'
+    }
+    
     GROUPBOX_STYLES = {
-        'default': {
-            'border': '1px solid #dddddd',
-            'border_radius': '3px',
-            'margin_top': '8px',
-            'padding_top': '8px',
-            'background_color': '#f5f5f5',  # Light gray background
-            'title_color': '#333333',
-            'title_font_weight': 'bold'
-        },
-        
-        # Data Tab block styles
-        'specimen_group': {
-            'border': '1px solid #dddddd',
-            'border_radius': '3px',
-            'margin_top': '8px',
-            'padding_top': '8px',
-            'background_color': '#f5f5f5',  # Light gray background
-            'title_color': '#333333',
-            'title_font_weight': 'bold'
-        },
-        
-        'range_group': {
-            'border': '1px solid #dddddd',
-            'border_radius': '3px',
-            'margin_top': '8px',
-            'padding_top': '8px',
-            'background_color': '#f5f5f5',  # Light gray background
-            'title_color': '#333333',
-            'title_font_weight': 'bold'
-        },
-        
-        'control_group': {
-            'border': '1px solid #dddddd',
-            'border_radius': '3px',
-            'margin_top': '8px',
-            'padding_top': '8px',
-            'background_color': '#f5f5f5',  # Light gray background
-            'title_color': '#333333',
-            'title_font_weight': 'bold'
-        },
-        
-        'data_display_group': {
-            'border': '1px solid #dddddd',
-            'border_radius': '3px',
-            'margin_top': '8px',
-            'padding_top': '8px',
-            'background_color': '#f5f5f5',  # Light gray background
-            'title_color': '#333333',
-            'title_font_weight': 'bold'
-        },
-        
-        'plots_container': {
-            'border': '1px solid #dddddd',
-            'border_radius': '3px',
-            'margin_top': '8px',
-            'padding_top': '8px',
-            'background_color': '#f5f5f5',  # Light gray background
-            'title_color': '#333333',
-            'title_font_weight': 'bold'
-        },
-        
-        'data_group': {
-            'border': '1px solid #dddddd',
-            'border_radius': '3px',
-            'margin_top': '8px',
-            'padding_top': '8px',
-            'background_color': '#f5f5f5',  # Light gray background
-            'title_color': '#333333',
-            'title_font_weight': 'bold'
-        },
-        
-        'filter_group': {
-            'border': '1px solid #dddddd',
-            'border_radius': '3px',
-            'margin_top': '8px',
-            'padding_top': '8px',
-            'background_color': '#f5f5f5',  # Light gray background
-            'title_color': '#333333',
-            'title_font_weight': 'bold'
-        },
-        
-        # Selection Tab block styles
-        'tree_group': {
-            'border': '1px solid #dddddd',
-            'border_radius': '3px',
-            'margin_top': '8px',
-            'padding_top': '8px',
-            'background_color': '#f5f5f5',  # Light gray background
-            'title_color': '#333333',
-            'title_font_weight': 'bold'
-        },
+        **dict.fromkeys((
+            'default',
+            # Data Tab block styles
+            'specimen_group', 'range_group', 'control_group', 'data_display_group',
+            'plots_container', 'data_group', 'filter_group',
+            # Selection Tab block styles
+            'tree_group',
+        ), _GROUPBOX_DEFAULT),
         
         # Individual plot group styles
         'individual_plot': {
@@ -606,6 +622,7 @@ class LayoutConfig:
     
     # Style generation methods
     @classmethod
+    @_cached_style
     def get_main_window_style(cls):
         """Get main window style"""
         mw_style = cls.MAIN_WINDOW_STYLES
@@ -623,6 +640,7 @@ class LayoutConfig:
         """
     
     @classmethod
+    @_cached_style
     def get_tab_widget_style(cls):
         """Get Tab widget style"""
         tab_style = cls.MAIN_WINDOW_STYLES['tab_widget']
@@ -657,6 +675,7 @@ class LayoutConfig:
         """
     
     @classmethod
+    @_cached_style
     def get_menu_bar_style(cls):
         """Get menu bar style"""
         menu_style = cls.MENU_STYLES
@@ -693,6 +712,7 @@ class LayoutConfig:
         """
     
     @classmethod
+    @_cached_style
     def get_splitter_style(cls):
         """Get splitter style"""
         splitter_style = cls.SPLITTER_STYLES['splitter']
@@ -703,6 +723,13 @@ class LayoutConfig:
             }}
         """
     
+    @classmethod
+    @_cached_style
+    def get_global_stylesheet(cls):
+        """Get the window-wide stylesheet (main window and menu bar) as one string"""
+        qss = cls.get_main_window_style() + cls.get_menu_bar_style()
+        return qss if cls.DEBUG_STYLESHEET else _minify_qss(qss)
+    
     @classmethod
     def apply_theme(cls, theme_name='default'):
         """Apply theme to all block styles"""
@@ -711,31 +738,30 @@ class LayoutConfig:
         
         theme = cls.THEMES[theme_name]
         
-        # Update border colors for all block styles
-        for style_name in cls.GROUPBOX_STYLES:
-            cls.GROUPBOX_STYLES[style_name]['border'] = f"{theme['border_width']} solid {theme['border_color']}"
-            cls.GROUPBOX_STYLES[style_name]['background_color'] = theme['background']
+        # Update border colors for all block styles, once per distinct (shared) style dict
+        themed = {
+            'border': f"{theme['border_width']} solid {theme['border_color']}",
+            'background_color': theme['background']
+        }
+        for style in {id(style): style for style in cls.GROUPBOX_STYLES.values()}.values():
+            style.update(themed)
+        
+        # Regenerate stylesheets on next request
+        cls._style_cache.clear()
     
     @classmethod
     def get_adaptive_font_size(cls, text, available_width, base_font_size=9):
         """Calculate adaptive font size based on available width"""
-        if not cls.ADAPTIVE_FONT['enable_auto_scale']:
+        font = cls.ADAPTIVE_FONT
+        if not font['enable_auto_scale']:
             return base_font_size
-            
-        # Estimate text width (rough calculation)
-        char_width_ratio = 0.6  # Character width ratio
-        estimated_width = len(text) * base_font_size * char_width_ratio
-        
-        if estimated_width <= available_width:
-            return min(base_font_size, cls.ADAPTIVE_FONT['max_font_size'])
-        
-        # Calculate required font size
-        scale_factor = available_width / estimated_width
-        new_font_size = int(base_font_size * scale_factor * cls.ADAPTIVE_FONT['scaling_factor'])
         
-        return max(cls.ADAPTIVE_FONT['min_font_size'], min(new_font_size, cls.ADAPTIVE_FONT['max_font_size']))
+        # Only the text length matters, so results are shared across texts
+        return _adaptive_font_size(len(text), available_width, base_font_size,
+                                   font['min_font_size'], font['max_font_size'], font['scaling_factor'])
     
     @classmethod
+    @_cached_style
     def get_tree_widget_style(cls):
         """Get tree widget style"""
         tree_style = cls.SELECTION_TAB_STYLES['tree_widget']
@@ -823,6 +849,7 @@ class LayoutConfig:
         """
     
     @classmethod
+    @_cached_style
     def get_scroll_area_style(cls):
         """Get scroll area style"""
         scroll_style = cls.SELECTION_TAB_STYLES['scroll_area']
@@ -885,6 +912,7 @@ class LayoutConfig:
         """
     
     @classmethod
+    @_cached_style
     def get_selection_info_style(cls):
         """Get selection info label style"""
         info_style = cls.SELECTION_TAB_STYLES['selection_info']
@@ -901,6 +929,7 @@ class LayoutConfig:
         """
     
     @classmethod
+    @_cached_style
     def get_selection_splitter_style(cls):
         """Get selection splitter style"""
         splitter_style = cls.SELECTION_TAB_STYLES['splitter']
@@ -916,6 +945,7 @@ class LayoutConfig:
         """
     
     @classmethod
+    @_cached_style
     def get_preview_group_style(cls):
         """Get main preview group style"""
         style = cls.PREVIEW_STYLES['preview_group']
@@ -937,6 +967,7 @@ class LayoutConfig:
         """
     
     @classmethod
+    @_cached_style
     def get_preview_subgroup_style(cls, group_type='single_site'):
         """Get preview subgroup style"""
         if group_type == 'single_site':
@@ -962,6 +993,7 @@ class LayoutConfig:
         """
     
     @classmethod
+    @_cached_style
     def get_site_selector_style(cls):
         """Get site selector style - unified with other dropdowns"""
         style = cls.PREVIEW_STYLES['site_selector']
@@ -1012,6 +1044,7 @@ class LayoutConfig:
         }
     
     @classmethod
+    @_cached_style
     def get_preview_export_button_style(cls):
         """Get preview export button style - unified with other buttons"""
         style = cls.PREVIEW_STYLES['export_button']
@@ -1043,6 +1076,7 @@ class LayoutConfig:
         """
     
     @classmethod
+    @_cached_style
     def get_preview_canvas_style(cls):
         """Get preview canvas style"""
         style = cls.PREVIEW_STYLES['canvas']
@@ -1052,4 +1086,14 @@ class LayoutConfig:
                 border: {style['border']};
                 border-radius: {style['border_radius']};
             }}
-        """
\ No newline at end of file
+        """
+
+
+# Build the static selection and preview stylesheets once at import, so the
+# getters are plain cache reads when the widgets are constructed
+for _getter in ('get_selection_info_style', 'get_selection_splitter_style', 'get_preview_group_style',
+                'get_site_selector_style', 'get_preview_export_button_style', 'get_preview_canvas_style'):
+    getattr(LayoutConfig, _getter)()
+for _group_type in ('single_site', 'all_site'):
+    LayoutConfig.get_preview_subgroup_style(_group_type)
+del _getter, _group_type
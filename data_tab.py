@@ -3,13 +3,18 @@ from PySide6.QtWidgets import (
     QComboBox, QTextEdit, QSizePolicy, QPushButton, QLineEdit, QScrollArea,
     QGridLayout
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot
 from PySide6.QtGui import QShortcut, QKeySequence
+from matplotlib.collections import PathCollection
 from mpl_canvas import MplCanvas
 from entrance import TestData
 from config import LayoutConfig
 import numpy as np
 
+# Line colors and markers cycled by plot index
+_PLOT_COLORS = ('blue', 'red', 'green', 'purple', 'orange', 'brown', 'pink', 'gray', 'olive', 'cyan')
+_PLOT_MARKERS = ('o', 's', '^', 'v', 'D', 'p', '*', 'h', '+', 'x')
+
 
 class DataTab(QWidget):
     def __init__(self, main_window):
@@ -68,6 +73,13 @@ class DataTab(QWidget):
         
         layout.addLayout(middle_layout, 1)
 
+        # Keep direct references so the groups can be swapped without scanning layouts
+        self._top_layout = top_layout
+        self._middle_layout = middle_layout
+        self._filter_group = filter_group
+        self._plots_container = plots_container
+        self._data_group = data_group
+
         # After creating filter inputs, setup their callbacks
         self.setup_filter_input_callbacks()
 
@@ -183,6 +195,11 @@ class DataTab(QWidget):
         down_layout.addWidget(self.range_down_combo)
         range_layout.addLayout(down_layout)
         
+        # Parse the range once per combo change; get_range() returns the cached ints
+        self._range_up, self._range_down = 100, 1
+        self.range_up_combo.currentTextChanged.connect(self._cache_range)
+        self.range_down_combo.currentTextChanged.connect(self._cache_range)
+        
         # Add two rows to vertical layout
         range_layout.addLayout(up_layout)
         range_layout.addLayout(down_layout)
@@ -249,21 +266,26 @@ class DataTab(QWidget):
         scroll_content = QWidget()
         scroll_content.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         scroll_content.wheelEvent = self.scroll_area_wheel_event
-        main_grid_layout = QGridLayout(scroll_content)
-        main_grid_layout.setSpacing(config['grid_spacing'])
-        main_grid_layout.setContentsMargins(*config['scroll_margins'])
-        self.plot_groups = []
-        self.canvases = []
+        # One HBox row per pair of plots (2 columns, n rows)
+        rows_layout = QVBoxLayout(scroll_content)
+        rows_layout.setSpacing(config['grid_spacing'])
+        rows_layout.setContentsMargins(*config['scroll_margins'])
+        # Sized up front; each slot is filled by index as its group is built
+        self.plot_groups = [None] * len(self.plot_titles)
+        self.canvases = [None] * len(self.plot_titles)
         
         for i in range(len(self.plot_titles)):
             plot_group = self.create_individual_plot_group(i, self.plot_titles[i])
-            self.plot_groups.append(plot_group)
-            row = i // 2
-            col = i % 2
+            self.plot_groups[i] = plot_group
+            if i % 2 == 0:
+                row_layout = QHBoxLayout()
+                row_layout.setSpacing(config['grid_spacing'])
+                rows_layout.addLayout(row_layout, 1)
             
-            main_grid_layout.addWidget(plot_group, row, col)
-            main_grid_layout.setRowStretch(row, 1)
-            main_grid_layout.setColumnStretch(col, 1)
+            row_layout.addWidget(plot_group, 1)
+        # Keep a lone plot in the last row at column width
+        if len(self.plot_titles) % 2:
+            row_layout.addStretch(1)
         scroll_area.setWidget(scroll_content)
         self.scroll_area = scroll_area
         
@@ -288,13 +310,15 @@ class DataTab(QWidget):
         
         # Refresh button
         refresh_btn = QPushButton("Refresh")
-        refresh_btn.clicked.connect(lambda checked, idx=index: self.refresh_plot(idx))
+        refresh_btn.setProperty("plot_idx", index)
+        refresh_btn.clicked.connect(self._on_refresh_clicked)
         refresh_btn.setMaximumWidth(config['button_max_width'])
         refresh_btn.setStyleSheet(self._get_button_style())
         
         # Export button
         export_btn = QPushButton("Export")
-        export_btn.clicked.connect(lambda checked, idx=index: self.export_plot(idx))
+        export_btn.setProperty("plot_idx", index)
+        export_btn.clicked.connect(self._on_export_clicked)
         export_btn.setMaximumWidth(config['button_max_width'])
         export_btn.setStyleSheet(self._get_button_style())
         
@@ -313,14 +337,12 @@ class DataTab(QWidget):
         canvas.setFixedAspectRatio(True)
         
         # Initialize axes
-        canvas.ax.set_title(title)
-        canvas.ax.text(0.5, 0.5, f'{title}\n(No Data)', 
-                      ha='center', va='center', transform=canvas.ax.transAxes)
-        canvas.ax.grid(True, alpha=0.3)
+        self._set_no_data_placeholder(canvas, title)
         canvas.ax.set_aspect('equal', adjustable='box')
-        canvas.draw()
+        # No eager draw(): the canvas renders on its first resize/show
+        canvas._plot_style = self._plot_style(index)
         
-        self.canvases.append(canvas)
+        self.canvases[index] = canvas
         
         # Add to plot group layout
         plot_layout.addLayout(control_layout)
@@ -336,6 +358,15 @@ class DataTab(QWidget):
         data_group.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
         data_group.setMinimumWidth(config['min_width'])
         data_group.setMaximumWidth(config['max_width'])
+        # Children are styled by role; data boxes switch filter colors via filterState
+        data_group.setStyleSheet(f"""
+            QLabel[role="data_label"] {{
+                font-weight: {self.config.STYLES['label']['font_weight']};
+                color: {self.config.STYLES['label']['color']};
+                font-size: {self.config.STYLES['label']['font_size']['small']};
+            }}
+        """ + self._get_data_display_style().replace('QLineEdit', 'QLineEdit[role="data_display"]')
+            + self._get_filter_state_style())
         
         data_layout = QVBoxLayout()
         data_layout.setContentsMargins(*config['margins'])
@@ -350,11 +381,7 @@ class DataTab(QWidget):
             # Create label
             label = QLabel(label_text)
             label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            label.setStyleSheet(f"""
-                font-weight: {self.config.STYLES['label']['font_weight']};
-                color: {self.config.STYLES['label']['color']};
-                font-size: {self.config.STYLES['label']['font_size']['small']};
-            """)
+            label.setProperty("role", "data_label")
             label.setWordWrap(True)
             
             # Create data display box
@@ -365,7 +392,7 @@ class DataTab(QWidget):
             data_display.setReadOnly(True)
             data_display.setAlignment(Qt.AlignmentFlag.AlignCenter)
             data_display.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-            data_display.setStyleSheet(self._get_data_display_style())
+            data_display.setProperty("role", "data_display")
             data_container.addWidget(label)
             data_container.addWidget(data_display)
             container_widget = QWidget()
@@ -465,6 +492,27 @@ class DataTab(QWidget):
             }}
         """
 
+    def _get_filter_state_style(self):
+        """Get data box filter state styles keyed on the filterState property"""
+        return "".join(self.config.STYLES['filter_qss'].values())
+
+    def set_filter_state(self, data_box, state):
+        """Switch a data box to 'default', 'match' or 'no_match' via its filterState property"""
+        if data_box.property('filterState') == state:
+            return
+        data_box.setProperty('filterState', state)
+        data_box.style().unpolish(data_box)
+        data_box.style().polish(data_box)
+
+    def reset_filter_states(self):
+        """Return every data box to the default filter state with a single repaint"""
+        self._data_group.setUpdatesEnabled(False)
+        try:
+            for data_box in self.data_boxes:
+                self.set_filter_state(data_box, 'default')
+        finally:
+            self._data_group.setUpdatesEnabled(True)
+
     def _get_groupbox_style(self, style_name='default'):
         """Get group box style from config"""
         if not hasattr(self.config, 'GROUPBOX_STYLES'):
@@ -504,38 +552,79 @@ class DataTab(QWidget):
             }}
         """
 
+    def _plot_style(self, plot_index):
+        """Return the (color, marker, mode) used for a single-line plot slot"""
+        return (_PLOT_COLORS[plot_index % len(_PLOT_COLORS)],
+                _PLOT_MARKERS[plot_index % len(_PLOT_MARKERS)],
+                plot_index % 3)
+
+    def _set_no_data_placeholder(self, canvas, title):
+        """Populate an empty axes with the titled "(No Data)" placeholder; the caller draws"""
+        canvas.ax.set_title(title)
+        canvas.ax.text(0.5, 0.5, f'{title}\n(No Data)', 
+                      ha='center', va='center', transform=canvas.ax.transAxes)
+        canvas.ax.grid(True, alpha=0.3)
+
     def plot_dynamic_data(self, canvas, data, plot_index):
-        """Plot data dynamically based on data structure from entrance.py"""
-        canvas.ax.clear()
-        
-        # Check data type and plot accordingly
-        if 'y1' in data and 'y2' in data:
-            # Multi-line data
-            canvas.ax.plot(data['x'], data['y1'], 'b-o', linewidth=2, markersize=4, label='Line 1')
-            canvas.ax.plot(data['x'], data['y2'], 'r-s', linewidth=2, markersize=4, label='Line 2')
-            canvas.ax.legend()
+        """Plot data dynamically based on data structure from entrance.py
+        
+        Artists are created on the first call and updated in place afterwards,
+        until the axes is cleared.
+        """
+        ax = canvas.ax
+        kind = 'multi' if 'y1' in data and 'y2' in data else 'single'
+        cached = getattr(canvas, '_artists', None)
+        
+        if (cached and cached['kind'] == kind and
+                all(artist.axes is ax for artist in cached['artists'])):
+            # Reuse existing artists: update their data and rescale
+            if kind == 'multi':
+                line1, line2 = cached['artists']
+                line1.set_data(data['x'], data['y1'])
+                line2.set_data(data['x'], data['y2'])
+                ax.relim()
+            else:
+                artist = cached['artists'][0]
+                if isinstance(artist, PathCollection):
+                    offsets = np.column_stack((data['x'], data['y']))
+                    artist.set_offsets(offsets)
+                    ax.relim()
+                    ax.update_datalim(offsets)
+                else:
+                    artist.set_data(data['x'], data['y'])
+                    ax.relim()
+            ax.autoscale_view()
         else:
-            # Single line data - use different colors and styles for different plots
-            colors = ['blue', 'red', 'green', 'purple', 'orange', 'brown', 'pink', 'gray', 'olive', 'cyan']
-            markers = ['o', 's', '^', 'v', 'D', 'p', '*', 'h', '+', 'x']
+            ax.clear()
             
-            color = colors[plot_index % len(colors)]
-            marker = markers[plot_index % len(markers)]
+            # Check data type and plot accordingly
+            if kind == 'multi':
+                # Multi-line data
+                line1, = ax.plot(data['x'], data['y1'], 'b-o', linewidth=2, markersize=4, label='Line 1')
+                line2, = ax.plot(data['x'], data['y2'], 'r-s', linewidth=2, markersize=4, label='Line 2')
+                ax.legend()
+                artists = [line1, line2]
+            else:
+                # Single line data - use different colors and styles for different plots
+                color, marker, mode = getattr(canvas, '_plot_style', None) or self._plot_style(plot_index)
+                
+                if mode == 0:  # Line only
+                    artist, = ax.plot(data['x'], data['y'], color=color, linewidth=2)
+                elif mode == 1:  # Line + markers
+                    artist, = ax.plot(data['x'], data['y'], color=color, marker=marker, 
+                                      linewidth=2, markersize=4)
+                else:  # Markers only
+                    artist = ax.scatter(data['x'], data['y'], color=color, marker=marker, s=30)
+                artists = [artist]
             
-            if plot_index % 3 == 0:  # Line only
-                canvas.ax.plot(data['x'], data['y'], color=color, linewidth=2)
-            elif plot_index % 3 == 1:  # Line + markers
-                canvas.ax.plot(data['x'], data['y'], color=color, marker=marker, 
-                              linewidth=2, markersize=4)
-            else:  # Markers only
-                canvas.ax.scatter(data['x'], data['y'], color=color, marker=marker, s=30)
-        
-        canvas.ax.set_title(data['title'])
-        canvas.ax.set_xlabel(data['xlabel'])
-        canvas.ax.set_ylabel(data['ylabel'])
-        canvas.ax.grid(True, alpha=0.3)
-        canvas.ax.set_aspect('auto')
-        canvas.draw()
+            ax.grid(True, alpha=0.3)
+            ax.set_aspect('auto')
+            canvas._artists = {'kind': kind, 'artists': artists}
+        
+        ax.set_title(data['title'])
+        ax.set_xlabel(data['xlabel'])
+        ax.set_ylabel(data['ylabel'])
+        canvas.draw_idle()
 
     def update_all_plots(self, site, specimen):
         """Update all plots using data from entrance.py"""
@@ -553,12 +642,7 @@ class DataTab(QWidget):
 
     def load_specimen_data(self, site, specimen):
         """Load specimen data using test data generator from entrance.py"""
-        try:
-            range_up = int(self.range_up_combo.currentText())
-            range_down = int(self.range_down_combo.currentText())
-        except ValueError:
-            range_up = 100
-            range_down = 1
+        range_up, range_down = self.get_range()
         specimen_summary = self.test_data_generator.get_range_based_specimen_summary(
             site, specimen, range_up, range_down)
         for i, (key, value) in enumerate(specimen_summary.items()):
@@ -574,16 +658,13 @@ class DataTab(QWidget):
         try:
             specimen_data = self.test_data_generator.generate_specimen_data_full_range(site, specimen)
             
-            for canvas in self.canvases:
-                canvas.ax.clear()
-            
             # Generate plots for each canvas
             for i, canvas in enumerate(self.canvases):
                 if i >= self.test_data_generator.num_plots:
                     # Clear extra canvases
                     canvas.ax.clear()
                     canvas.ax.set_title(f'Plot {i+1} - No Data')
-                    canvas.draw()
+                    canvas.draw_idle()
                     continue
                 
                 plot_key = f'plot{i+1}'
@@ -594,7 +675,7 @@ class DataTab(QWidget):
                 else:
                     canvas.ax.clear()
                     canvas.ax.set_title(f'Plot {i+1} - No Data')
-                    canvas.draw()
+                    canvas.draw_idle()
                 
         except Exception as e:
             for canvas in self.canvases:
@@ -602,20 +683,15 @@ class DataTab(QWidget):
                 canvas.ax.set_title('Error Loading Plot')
                 canvas.ax.text(0.5, 0.5, f'Error: {str(e)}', 
                               ha='center', va='center', transform=canvas.ax.transAxes)
-                canvas.draw()
+                canvas.draw_idle()
 
     def load_specimen_data_boxes(self, site, specimen):
         """Load specimen data boxes using range-affected data"""
         if not hasattr(self, 'test_data_generator'):
             return
     
-        try:
-            # Get current range settings
-            range_up = int(self.range_up_combo.currentText())
-            range_down = int(self.range_down_combo.currentText())
-        except (ValueError, AttributeError):
-            range_up = 100
-            range_down = 1
+        # Get current range settings
+        range_up, range_down = self.get_range()
     
         try:
             # Use range-affected data to fill data boxes
@@ -679,16 +755,23 @@ class DataTab(QWidget):
                     data = specimen_data[plot_key]
                     self.plot_dynamic_data(canvas, data, index)
 
+    @Slot()
+    def _on_refresh_clicked(self):
+        """Refresh the plot whose index is stored on the clicked button"""
+        self.refresh_plot(self.sender().property("plot_idx"))
+
+    @Slot()
+    def _on_export_clicked(self):
+        """Export the plot whose index is stored on the clicked button"""
+        self.export_plot(self.sender().property("plot_idx"))
+
     def clear_plot(self, index):
         """Clear specified plot"""
         if 0 <= index < len(self.canvases):
             canvas = self.canvases[index]
             canvas.ax.clear()
-            canvas.ax.grid(True, alpha=0.3)
-            canvas.ax.set_title(self.plot_titles[index])
-            canvas.ax.text(0.5, 0.5, f'{self.plot_titles[index]}\n(No Data)', 
-                          ha='center', va='center', transform=canvas.ax.transAxes)
-            canvas.draw()
+            self._set_no_data_placeholder(canvas, self.plot_titles[index])
+            canvas.draw_idle()
 
     def scroll_area_wheel_event(self, event):
         """Handle scroll area mouse wheel event"""
@@ -853,6 +936,19 @@ class DataTab(QWidget):
         # Enable dropdown
         self.specimen_combo.setEnabled(True)
 
+    @Slot()
+    def _cache_range(self):
+        """Parse the range combo texts, falling back to (100, 1)"""
+        try:
+            self._range_up = int(self.range_up_combo.currentText())
+            self._range_down = int(self.range_down_combo.currentText())
+        except ValueError:
+            self._range_up, self._range_down = 100, 1
+
+    def get_range(self):
+        """Get the (range_up, range_down) selection parsed on the last combo change"""
+        return self._range_up, self._range_down
+
     def populate_range_lists(self):
         """Populate Range Tab dropdown lists"""
         if not hasattr(self, 'range_up_combo') or not hasattr(self, 'range_down_combo'):
@@ -991,11 +1087,8 @@ class DataTab(QWidget):
             for i, canvas in enumerate(self.canvases):
                 if i < len(self.plot_titles):
                     canvas.ax.clear()
-                    canvas.ax.set_title(self.plot_titles[i])
-                    canvas.ax.text(0.5, 0.5, f'{self.plot_titles[i]}\n(No Data)', 
-                                  ha='center', va='center', transform=canvas.ax.transAxes)
-                    canvas.ax.grid(True, alpha=0.3)
-                    canvas.draw()
+                    self._set_no_data_placeholder(canvas, self.plot_titles[i])
+                    canvas.draw_idle()
 
     def on_range_up_changed(self, value):
         """Handle range up selection change"""
@@ -1140,12 +1233,7 @@ class DataTab(QWidget):
             return
         
         # Get current range settings
-        try:
-            range_up = int(self.range_up_combo.currentText())
-            range_down = int(self.range_down_combo.currentText())
-        except (ValueError, AttributeError):
-            range_up = 100
-            range_down = 1
+        range_up, range_down = self.get_range()
         
         # Check this specific parameter condition independently
         param_match = test_data.check_parameter_condition_independently(
@@ -1158,13 +1246,13 @@ class DataTab(QWidget):
         # Apply color based on this parameter's condition only
         if not condition_str or not condition_str.strip():
             # No condition - default style
-            data_box.setStyleSheet("QLineEdit { background-color: white; color: black; }")
+            self.set_filter_state(data_box, 'default')
         elif param_match:
             # This parameter's condition is met - green
-            data_box.setStyleSheet("QLineEdit { background-color: lightgreen; color: black; }")
+            self.set_filter_state(data_box, 'match')
         else:
             # This parameter's condition is not met - red
-            data_box.setStyleSheet("QLineEdit { background-color: lightcoral; color: black; }")
+            self.set_filter_state(data_box, 'no_match')
 
     def apply_independent_parameter_colors(self, site, specimen):
         """Apply colors to data boxes based on independent parameter conditions"""
@@ -1174,72 +1262,29 @@ class DataTab(QWidget):
         test_data = self.test_data_generator
     
         # Get current range settings
-        try:
-            range_up = int(self.range_up_combo.currentText())
-            range_down = int(self.range_down_combo.currentText())
-        except (ValueError, AttributeError):
-            range_up = 100
-            range_down = 1
-        from config import LayoutConfig
-        filter_colors = LayoutConfig.STYLES['filter_colors']
+        range_up, range_down = self.get_range()
+    
+        condition_strs = [filter_input.text().strip() for filter_input
+                          in self.filter_inputs[:len(test_data.parameter_labels)]]
+        if not any(condition_strs):
+            self.reset_filter_states()
+            return
+        
+        param_matches = test_data.check_all_parameter_conditions(
+            site, specimen, condition_strs, range_up, range_down
+        )
     
         # Apply colors to each data box independently
         for i, data_box in enumerate(self.data_boxes):
-            if i < len(test_data.parameter_labels) and i < len(self.filter_inputs):
-                condition_str = self.filter_inputs[i].text().strip()
-                
-                # Check this specific parameter condition independently
-                param_match = test_data.check_parameter_condition_independently(
-                    site, specimen, i, condition_str, range_up, range_down
-                )
+            if i < len(condition_strs):
+                condition_str = condition_strs[i]
                 
-                if not condition_str or not condition_str.strip():
-                    # No condition - 
-                    data_box.setStyleSheet(f"""
-                        QLineEdit {{
-                            background-color: {filter_colors['default_background']};
-                            color: {filter_colors['default_text']};
-                            border: 1px solid #cccccc;
-                            border-radius: 3px;
-                            padding: 4px;
-                            font-size: 9pt;
-                        }}
-                    """)
-                elif param_match:
-                   
-                    data_box.setStyleSheet(f"""
-                        QLineEdit {{
-                            background-color: {filter_colors['match_background']};
-                            color: {filter_colors['match_text']};
-                            border: {filter_colors['match_border']};
-                            border-radius: 3px;
-                            padding: 4px;
-                            font-size: 9pt;
-                            font-weight: bold;
-                        }}
-                    """)
+                if not condition_str:
+                    self.set_filter_state(data_box, 'default')
+                elif param_matches[i]:
+                    self.set_filter_state(data_box, 'match')
                 else:
-                    data_box.setStyleSheet(f"""
-                        QLineEdit {{
-                            background-color: {filter_colors['no_match_background']};
-                            color: {filter_colors['no_match_text']};
-                            border: {filter_colors['no_match_border']};
-                            border-radius: 3px;
-                            padding: 4px;
-                            font-size: 9pt;
-                            font-weight: bold;
-                        }}
-                    """)
+                    self.set_filter_state(data_box, 'no_match')
             else:
-                
-                data_box.setStyleSheet(f"""
-                    QLineEdit {{
-                        background-color: {filter_colors['default_background']};
-                        color: {filter_colors['default_text']};
-                        border: 1px solid #cccccc;
-                        border-radius: 3px;
-                        padding: 4px;
-                        font-size: 9pt;
-                    }}
-                """)
+                self.set_filter_state(data_box, 'default')
 
@@ -1,9 +1,44 @@
 import sys
+import logging
 import numpy as np
 import re
+from functools import lru_cache
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QIcon
 
+logger = logging.getLogger(__name__)
+
+# Supported filter operators in order of precedence
+_FILTER_PATTERNS = (
+    (re.compile(r'^>=\s*(-?\d+\.?\d*)$'), '>='),
+    (re.compile(r'^<=\s*(-?\d+\.?\d*)$'), '<='),
+    (re.compile(r'^!=\s*(-?\d+\.?\d*)$'), '!='),
+    (re.compile(r'^>\s*(-?\d+\.?\d*)$'), '>'),
+    (re.compile(r'^<\s*(-?\d+\.?\d*)$'), '<'),
+    (re.compile(r'^=\s*(-?\d+\.?\d*)$'), '='),
+    (re.compile(r'^(-?\d+\.?\d*)$'), '='),
+)
+
+
+@lru_cache(maxsize=512)
+def _parse_filter_expression(expression):
+    """Parse a filter expression into (operator, value), cached by expression string"""
+    if not expression or not expression.strip():
+        return None
+        
+    expression = expression.strip()
+    
+    for pattern, operator in _FILTER_PATTERNS:
+        match = pattern.match(expression)
+        if match:
+            try:
+                value = float(match.group(1))
+                return (operator, value)
+            except (ValueError, IndexError):
+                continue
+    
+    return None
+
 
 class TestData:
     """Test data generator for scientific specimen analysis and visualization"""
@@ -206,32 +241,52 @@ class TestData:
         Returns:
             tuple: (operator, value) or None if invalid
         """
-        if not expression or not expression.strip():
+        return _parse_filter_expression(expression)
+
+    def compile_filter_expression(self, expression):
+        """
+        Compile filter expression into a predicate on displayed values
+        
+        Args:
+            expression (str): Filter expression (e.g., ">5", "<=10")
+            
+        Returns:
+            callable: predicate(value_str) -> bool, or None if invalid
+        """
+        parsed = self.parse_filter_expression(expression)
+        if not parsed:
             return None
+        
+        operator, threshold = parsed
+        # Equality uses string matching against the display format
+        threshold_formatted = self.format_significant_figures(threshold, 5).strip()
+        
+        if operator == '=':
+            def matches(value_str):
+                return value_str.strip() == threshold_formatted
+        elif operator == '!=':
+            def matches(value_str):
+                return value_str.strip() != threshold_formatted
+        else:
+            compare = {
+                '>': lambda a, b: a > b,
+                '>=': lambda a, b: a >= b,
+                '<': lambda a, b: a < b,
+                '<=': lambda a, b: a <= b,
+            }[operator]
             
-        expression = expression.strip()
-        
-        # Define supported operators in order of precedence
-        patterns = [
-            (r'^>=\s*(-?\d+\.?\d*)$', '>='),
-            (r'^<=\s*(-?\d+\.?\d*)$', '<='),
-            (r'^!=\s*(-?\d+\.?\d*)$', '!='),
-            (r'^>\s*(-?\d+\.?\d*)$', '>'),
-            (r'^<\s*(-?\d+\.?\d*)$', '<'),
-            (r'^=\s*(-?\d+\.?\d*)$', '='),
-            (r'^(-?\d+\.?\d*)$', '='),
-        ]
+            def matches(value_str):
+                return compare(self.parse_formatted_value(value_str), threshold)
         
-        for pattern, operator in patterns:
-            match = re.match(pattern, expression)
-            if match:
-                try:
-                    value = float(match.group(1))
-                    return (operator, value)
-                except (ValueError, IndexError):
-                    continue
+        def predicate(value_str):
+            if value_str == 'N/A' or not value_str:
+                return True  # No valid value, default to pass
+            try:
+                return matches(value_str)
+            except (ValueError, TypeError):
+                return True
         
-        return None
+        return predicate
 
     def check_parameter_condition_independently(self, site, specimen, parameter_index, condition_str, range_up=100, range_down=1):
         """
@@ -267,19 +322,21 @@ class TestData:
                 # Format threshold to same format as display value
                 threshold_formatted = self.format_significant_figures(threshold, 5)
                 
-                print(f"Debug: Parameter '{param_label}' - Display Value: '{specimen_value_str}', Formatted Threshold: '{threshold_formatted}', Condition: {operator}")
+                logger.debug("Parameter '%s' - Display Value: '%s', Formatted Threshold: '%s', Condition: %s",
+                             param_label, specimen_value_str, threshold_formatted, operator)
                 
                 # String exact comparison
                 result = specimen_value_str.strip() == threshold_formatted.strip()
                 
-                print(f"Debug: String comparison result = {result}")
+                logger.debug("String comparison result = %s", result)
                 return result
             
             # For other comparison operations, use numerical comparison
             specimen_value = self.parse_formatted_value(specimen_value_str)
             threshold_value = float(threshold)
             
-            print(f"Debug: Parameter '{param_label}' - Display Value: '{specimen_value_str}' ({specimen_value}), Threshold: {threshold_value}, Condition: {operator}")
+            logger.debug("Parameter '%s' - Display Value: '%s' (%s), Threshold: %s, Condition: %s",
+                         param_label, specimen_value_str, specimen_value, threshold_value, operator)
             
             if operator == '>':
                 result = specimen_value > threshold_value
@@ -296,13 +353,75 @@ class TestData:
             else:
                 result = True
             
-            print(f"Debug: Result = {result}")
+            logger.debug("Result = %s", result)
             return result
 
         except (ValueError, TypeError) as e:
-            print(f"Debug: Error parsing value '{specimen_value_str}': {e}")
+            logger.debug("Error parsing value '%s': %s", specimen_value_str, e)
             return True
 
+    def check_all_parameter_conditions(self, site, specimen, condition_strs, range_up=100, range_down=1):
+        """
+        Check every parameter condition in one vectorized pass
+        
+        Args:
+            site (str): Site name
+            specimen (str): Specimen name
+            condition_strs (sequence): Condition string per parameter index
+            range_up (int): Upper range limit
+            range_down (int): Lower range limit
+            
+        Returns:
+            np.ndarray: Boolean match per condition, same semantics as
+                check_parameter_condition_independently
+        """
+        result = np.ones(len(condition_strs), dtype=bool)
+        specimen_summary = None
+        
+        indices, operators, thresholds, value_strs = [], [], [], []
+        for i, condition_str in enumerate(condition_strs):
+            if i >= len(self.parameter_labels) or not condition_str or not condition_str.strip():
+                continue
+            parsed = self.parse_filter_expression(condition_str)
+            if not parsed:
+                continue
+            
+            if specimen_summary is None:
+                specimen_summary = self.get_range_based_specimen_summary(site, specimen, range_up, range_down)
+            value_str = specimen_summary.get(self.parameter_labels[i], '0')
+            if value_str == 'N/A' or not value_str:
+                continue
+            
+            indices.append(i)
+            operators.append(parsed[0])
+            thresholds.append(parsed[1])
+            value_strs.append(value_str.strip())
+        
+        if not indices:
+            return result
+        
+        indices = np.array(indices)
+        operators = np.array(operators)
+        thresholds = np.array(thresholds, dtype=float)
+        values = np.array([self.parse_formatted_value(v) for v in value_strs], dtype=float)
+        
+        # Equality operators compare display strings, the rest compare numerically
+        is_string_op = np.isin(operators, ('=', '!='))
+        string_equal = np.zeros(len(indices), dtype=bool)
+        for k in np.flatnonzero(is_string_op):
+            string_equal[k] = value_strs[k] == self.format_significant_figures(thresholds[k], 5).strip()
+        
+        result[indices] = np.select(
+            [operators == '=', operators == '!=',
+             operators == '>', operators == '>=',
+             operators == '<', operators == '<='],
+            [string_equal, ~string_equal,
+             values > thresholds, values >= thresholds,
+             values < thresholds, values <= thresholds],
+            default=True
+        )
+        return result
+
     def evaluate_condition_normalized(self, specimen_value, operator, threshold_value):
         """
         Evaluate condition using normalized values (5 significant figures)
@@ -1002,7 +1121,7 @@ class TestData:
                 canvas.ax.text(0.5, 0.5, 'No data to display', 
                               ha='center', va='center', transform=canvas.ax.transAxes,
                               fontsize=10, color='gray')
-                canvas.draw()
+                canvas.draw_idle()
                 return
             
             # Check if this is single site or all sites data
@@ -1018,7 +1137,7 @@ class TestData:
                               ha='center', va='center', transform=canvas.ax.transAxes,
                               fontsize=10, color='red')
             
-            canvas.draw()
+            canvas.draw_idle()
             
         except Exception as e:
             canvas.ax.clear()
@@ -1026,7 +1145,7 @@ class TestData:
             canvas.ax.text(0.5, 0.5, f'Error: {str(e)}', 
                           ha='center', va='center', transform=canvas.ax.transAxes,
                           fontsize=10, color='red')
-            canvas.draw()
+            canvas.draw_idle()
 
     def _plot_single_site_preview(self, canvas, plot_data):
         """Single Site Preview: specimen均值+1σ误差棒，选中为实心，未选中为空心，选中均值/1σ横线"""
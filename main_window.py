@@ -15,7 +15,7 @@ class MainWindow(QMainWindow):
         self.config = LayoutConfig()
         self.setWindowTitle(self.config.MAIN_WINDOW['title'])
         self.resize(*self.config.MAIN_WINDOW['size'])
-        self.setStyleSheet(self.config.get_main_window_style())
+        self.setStyleSheet(self.config.get_global_stylesheet())
         self.current_folder = ""
         self.current_file = ""
         self.menu_manager = MenuManager(self)
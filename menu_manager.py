@@ -15,13 +15,9 @@ class MenuManager:
 
     def create_menu_bar(self):
         """Create menu bar with all required menus"""
-        from config import LayoutConfig
-        
+        # Menu styling comes from the main window's global stylesheet
         menubar = self.main_window.menuBar()
         
-        # Apply menu styling from configuration
-        menubar.setStyleSheet(LayoutConfig.get_menu_bar_style())
-        
         # Create individual menus
         self.create_file_menu(menubar)
         self.create_style_menu(menubar)
@@ -196,7 +192,7 @@ class MenuManager:
                                     text.set_alpha(style['alpha'])
                             
                             # Refresh canvas
-                            canvas.draw()
+                            canvas.draw_idle()
                             applied_count += 1
                             
                         except Exception as e:
@@ -1,4 +1,3 @@
-import matplotlib.pyplot as plt
 # Fix: Use the correct backend for PySide6
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
@@ -106,15 +105,26 @@ class MplCanvas(FigureCanvas):
                 self.resize(size, size)
         super().resizeEvent(event)
 
+    def _draw_idle(self):
+        """
+        Render a pending idle draw only while part of the canvas is on screen
+        
+        Canvases scrolled out of view (or on a hidden tab) keep the draw
+        pending; the backend's paintEvent renders it once they are exposed.
+        """
+        if self._draw_pending and self.visibleRegion().isEmpty():
+            return
+        super()._draw_idle()
+
     def clear_plot(self):
         """Clear the current plot and reset axes"""
         self.ax.clear()
-        self.draw()
+        self.draw_idle()
 
     def update_plot(self):
         """Update the plot display"""
         self.fig.tight_layout()
-        self.draw()
+        self.draw_idle()
 
     def save_plot(self, filename, **kwargs):
         """
@@ -142,7 +152,7 @@ class MplCanvas(FigureCanvas):
         """
         self.fig.patch.set_facecolor(color)
         self.ax.set_facecolor(color)
-        self.draw()
+        self.draw_idle()
 
     def get_figure(self):
         """
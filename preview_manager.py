@@ -305,7 +305,7 @@ class PreviewManager:
         self.single_site_canvas.ax.text(0.5, 0.5, 'Select a site from dropdown above', 
                                        ha='center', va='center', transform=self.single_site_canvas.ax.transAxes,
                                        fontsize=10, color='gray')
-        self.single_site_canvas.draw()
+        self.single_site_canvas.draw_idle()
         
         # Clear All Site Preview
         self.all_site_canvas.ax.clear()
@@ -313,20 +313,13 @@ class PreviewManager:
         self.all_site_canvas.ax.text(0.5, 0.5, 'No data available', 
                                     ha='center', va='center', transform=self.all_site_canvas.ax.transAxes,
                                     fontsize=10, color='gray')
-        self.all_site_canvas.draw()
+        self.all_site_canvas.draw_idle()
 
     def get_current_range_settings(self):
         """Get current range settings"""
-        range_up = 100
-        range_down = 1
         if hasattr(self.main_window, 'data_tab'):
-            if hasattr(self.main_window.data_tab, 'range_up_combo'):
-                try:
-                    range_up = int(self.main_window.data_tab.range_up_combo.currentText())
-                    range_down = int(self.main_window.data_tab.range_down_combo.currentText())
-                except:
-                    pass
-        return range_up, range_down
+            return self.main_window.data_tab.get_range()
+        return 100, 1
 
     def update_single_site_preview(self, site_name):
         """Update Single Site Preview using current range settings for data box compatibility"""
@@ -336,7 +329,7 @@ class PreviewManager:
             self.single_site_canvas.ax.text(0.5, 0.5, 'Select a site from dropdown above', 
                                            ha='center', va='center', transform=self.single_site_canvas.ax.transAxes,
                                            fontsize=10, color='gray')
-            self.single_site_canvas.draw()
+            self.single_site_canvas.draw_idle()
             return
         
         if not hasattr(self.main_window, 'data_tab') or not hasattr(self.main_window.data_tab, 'test_data_generator'):
@@ -392,9 +385,11 @@ class PreviewManager:
         if file_path:
             try:
                 # Create combined plot
-                import matplotlib.pyplot as plt
+                # Detached Figure: rendered by Agg on savefig, no pyplot/GUI manager
+                from matplotlib.figure import Figure
                 
-                fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8))
+                fig = Figure(figsize=(10, 8))
+                ax1, ax2 = fig.subplots(2, 1)
                 
                 # Copy Single Site Preview
                 for line in self.single_site_canvas.ax.get_lines():
@@ -426,9 +421,8 @@ class PreviewManager:
                 ax2.set_ylabel(self.all_site_canvas.ax.get_ylabel())
                 ax2.grid(True, alpha=0.3)
                 
-                plt.tight_layout()
-                plt.savefig(file_path, dpi=300, bbox_inches='tight')
-                plt.close()
+                fig.tight_layout()
+                fig.savefig(file_path, dpi=300, bbox_inches='tight')
                 
                 QMessageBox.information(None, "Export Success", f"Plots exported to: {file_path}")
                 